@@ -1,6 +1,7 @@
 import os
 import uuid
 import time
+import atexit
 import requests
 import re
 from flask import Flask, request, jsonify
@@ -152,17 +153,23 @@ def monitor_tron_addresses():
                 current_payments = Payment.get_pending_payments()
                 
                 if not current_payments:
+                    # Выгружаем буферизованные логи (например, события
+                    # истечения) и в холостых циклах тоже
+                    PaymentLog.flush_logs()
                     app.logger.debug("No payments to monitor, sleeping...")
                     time.sleep(POLLING_INTERVAL_SECONDS)
                     continue
-                
+
                 for payment in current_payments:
                     try:
                         process_pending_payment(payment)
                     except (requests.exceptions.RequestException, ValueError) as e:
                         app.logger.error("Error processing payment %s: %s", payment.id, e)
                         PaymentLog.log_event(payment.id, 'error', f'Processing error: {str(e)}')
-                        
+
+                # Раз в цикл опроса сбрасываем буфер логов в базу
+                PaymentLog.flush_logs()
+
             except Exception as e:
                 app.logger.error("Error in monitor thread: %s", e)
                 
@@ -421,6 +428,16 @@ def get_stats():
 
 # --- Запуск приложения и монитора ---
 
+def _flush_logs_at_exit():
+    """Сбрасывает оставшиеся в буфере логи платежей при завершении"""
+    try:
+        with app.app_context():
+            PaymentLog.flush_logs()
+    except Exception as e:
+        app.logger.error("Failed to flush buffered payment logs at exit: %s", e)
+
+atexit.register(_flush_logs_at_exit)
+
 if __name__ == '__main__':
     # Создаем таблицы базы данных при первом запуске
     with app.app_context():
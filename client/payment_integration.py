@@ -17,9 +17,15 @@ Usage:
 import json
 import requests
 import argparse
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from tron_address_manager import TronAddressManager
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 class PaymentServiceIntegration:
     """Integration with the main TRON payment monitoring service"""
     
@@ -96,35 +102,50 @@ class PaymentServiceIntegration:
             print(f"❌ Failed to send payment request")
             return False
     
+    def _iter_payment_file(self, filename: str) -> Iterator[Dict]:
+        """Yield payment requests from a JSON array file one at a time
+
+        With ijson installed the file is parsed incrementally, so memory
+        stays flat and the first request goes out before the whole file
+        has been decoded. Otherwise falls back to loading the full list.
+        """
+        if IJSON_AVAILABLE:
+            with open(filename, 'rb') as f:
+                for payment in ijson.items(f, 'item'):
+                    yield payment
+        else:
+            with open(filename, 'r', encoding='utf-8') as f:
+                payments = json.load(f)
+            if not isinstance(payments, list):
+                raise ValueError("File must contain a JSON array of payment requests")
+            for payment in payments:
+                yield payment
+
     def batch_send_payments(self, filename: str) -> Dict[str, int]:
         """Send multiple payment requests from a JSON file"""
+        print(f"🔄 Sending payment requests from {filename}...")
+
+        sent = 0
+        failed = 0
+
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                payments = json.load(f)
+            for i, payment in enumerate(self._iter_payment_file(filename), 1):
+                print(f"Processing payment {i}: {payment.get('order_id', 'Unknown')}")
+
+                result = self.send_payment_request(payment)
+                if result:
+                    print(f"   ✅ Sent successfully (Service ID: {result.get('payment_id')})")
+                    sent += 1
+                else:
+                    print(f"   ❌ Failed to send")
+                    failed += 1
+        except ValueError as e:
+            print(f"❌ {e}")
+            return {'sent': sent, 'failed': failed}
         except Exception as e:
             print(f"❌ Error reading file {filename}: {e}")
-            return {'sent': 0, 'failed': 0}
-        
-        if not isinstance(payments, list):
-            print(f"❌ File must contain a JSON array of payment requests")
-            return {'sent': 0, 'failed': 0}
-        
-        print(f"🔄 Sending {len(payments)} payment requests...")
-        
-        sent = 0
-        failed = 0
-        
-        for i, payment in enumerate(payments, 1):
-            print(f"Processing payment {i}/{len(payments)}: {payment.get('order_id', 'Unknown')}")
-            
-            result = self.send_payment_request(payment)
-            if result:
-                print(f"   ✅ Sent successfully (Service ID: {result.get('payment_id')})")
-                sent += 1
-            else:
-                print(f"   ❌ Failed to send")
-                failed += 1
-        
+            return {'sent': sent, 'failed': failed}
+
         print(f"\n📊 Batch Results: {sent} sent, {failed} failed")
         return {'sent': sent, 'failed': failed}
     
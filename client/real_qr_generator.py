@@ -12,11 +12,16 @@ Usage:
     python real_qr_generator.py --mnemonic "word1 word2 ... word12" --style rounded --output mnemonic.png
 """
 
+import io
 import os
 import json
 import sqlite3
 import argparse
+import functools
+import queue
 import sys
+import threading
+from contextlib import closing
 from typing import Dict, List, Optional
 
 try:
@@ -31,29 +36,114 @@ except ImportError as e:
     print("Install with: sudo apt install python3-qrcode python3-pil")
     sys.exit(1)
 
+try:
+    import segno
+    SEGNO_AVAILABLE = True
+except ImportError:
+    SEGNO_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _complete_wallet_json(wallet: Dict) -> str:
+    """Serialize the fixed-shape complete-wallet payload compactly
+
+    The key order is bound once here; orjson (when installed) skips the
+    stdlib encoder's per-call dispatch, which adds up in batch runs.
+    """
+    wallet_info = {
+        'address': wallet.get('address'),
+        'privateKey': wallet.get('private_key'),
+        'mnemonic': wallet.get('mnemonic_phrase'),
+        'derivationPath': wallet.get('derivation_path'),
+        'network': 'mainnet'
+    }
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(wallet_info).decode()
+    return json.dumps(wallet_info, separators=(',', ':'))
+
+FONT_BOLD_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+FONT_REGULAR_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+@functools.lru_cache(maxsize=8)
+def _load_font(font_path: str, font_size: int):
+    """Load a truetype font, falling back to the PIL default"""
+    try:
+        return ImageFont.truetype(font_path, font_size)
+    except (OSError, IOError):
+        return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=256)
+def _text_size(text: str, font_path: str, font_size: int) -> tuple:
+    """Measure rendered text size, memoized per (text, font)
+
+    Labels like "Address" and "Private Key" recur on every wallet in a
+    batch run, so caching skips the repeated FreeType glyph shaping.
+    """
+    font = _load_font(font_path, font_size)
+    bbox = ImageDraw.Draw(Image.new('L', (1, 1))).textbbox((0, 0), text, font=font)
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
 class RealQRCodeGenerator:
     """Generate real QR code images for TRON wallets"""
     
     def __init__(self, db_path: str = "mnemonic_wallets.db"):
         self.db_path = db_path
-    
+        self._wallet_cache: Dict[int, Dict] = {}
+
     def get_wallet_from_db(self, wallet_id: int) -> Optional[Dict]:
         """Get wallet data from database"""
+        # Serve repeat lookups (e.g. import sheet after QR generation)
+        # from the per-run cache instead of a fresh query
+        cached = self._wallet_cache.get(wallet_id)
+        if cached is not None:
+            return cached
+
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM wallets WHERE id = ?', (wallet_id,))
-            row = cursor.fetchone()
-            
-            if row:
-                columns = [description[0] for description in cursor.description]
-                return dict(zip(columns, row))
-            
-            conn.close()
-            return None
+            # closing() releases the connection on every path — the old
+            # code returned the found wallet before its conn.close()
+            with closing(sqlite3.connect(self.db_path)) as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('SELECT * FROM wallets WHERE id = ?', (wallet_id,))
+                row = cursor.fetchone()
+
+                if row:
+                    columns = [description[0] for description in cursor.description]
+                    wallet = dict(zip(columns, row))
+                    self._wallet_cache[wallet_id] = wallet
+                    return wallet
+
+                return None
         except sqlite3.Error:
             return None
+
+    def get_wallets(self, wallet_ids: List[int]) -> Dict[int, Dict]:
+        """Get several wallets in one query, keyed by wallet ID"""
+        if not wallet_ids:
+            return {}
+
+        try:
+            # closing() so the handle is released even when the query
+            # raises, same as the single-wallet lookup above
+            with closing(sqlite3.connect(self.db_path)) as conn:
+                cursor = conn.cursor()
+
+                placeholders = ','.join('?' * len(wallet_ids))
+                cursor.execute(f'SELECT * FROM wallets WHERE id IN ({placeholders})', wallet_ids)
+                columns = [description[0] for description in cursor.description]
+                wallets = {}
+                for row in cursor.fetchall():
+                    wallet = dict(zip(columns, row))
+                    wallets[wallet['id']] = wallet
+
+            self._wallet_cache.update(wallets)
+            return wallets
+        except sqlite3.Error:
+            return {}
     
     def create_qr_code(self, data: str, style: str = "default", error_correction: str = "M") -> qrcode.QRCode:
         """Create a QR code object with specified style"""
@@ -75,9 +165,28 @@ class RealQRCodeGenerator:
         
         qr.add_data(data)
         qr.make(fit=True)
-        
+
         return qr
-    
+
+    def create_qr_image(self, data: str, style: str = "default", error_correction: str = "M") -> Image.Image:
+        """Create a QR code image, using the C-backed segno encoder when possible"""
+
+        # segno keeps the Reed-Solomon and masking work out of Python bytecode,
+        # which dominates encode time for long data at high error correction.
+        # Styled module drawers still need the qrcode/PIL pipeline.
+        if SEGNO_AVAILABLE and style == "default":
+            buffer = io.BytesIO()
+            segno.make(
+                data,
+                error=error_correction.lower(),
+                boost_error=False
+            ).save(buffer, kind='png', scale=10, border=4)
+            buffer.seek(0)
+            return Image.open(buffer).convert('RGB')
+
+        qr = self.create_qr_code(data, style, error_correction)
+        return self.create_styled_image(qr, style)
+
     def create_styled_image(self, qr: qrcode.QRCode, style: str = "default") -> Image.Image:
         """Create styled QR code image"""
         
@@ -124,26 +233,20 @@ class RealQRCodeGenerator:
             draw = ImageDraw.Draw(new_img)
             
             # Try to use a system font, fallback to default
-            try:
-                font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
-                font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-            except (OSError, IOError):
-                font_large = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-            
+            font_large = _load_font(FONT_BOLD_PATH, 16)
+            font_small = _load_font(FONT_REGULAR_PATH, 12)
+
             # Calculate text positions
             text_y_start = img_height + 10
-            
+
             # Draw main label
-            label_bbox = draw.textbbox((0, 0), label, font=font_large)
-            label_width = label_bbox[2] - label_bbox[0]
+            label_width, _ = _text_size(label, FONT_BOLD_PATH, 16)
             label_x = (img_width - label_width) // 2
             draw.text((label_x, text_y_start), label, fill="black", font=font_large)
-            
+
             # Draw subtitle if provided
             if subtitle:
-                subtitle_bbox = draw.textbbox((0, 0), subtitle, font=font_small)
-                subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
+                subtitle_width, _ = _text_size(subtitle, FONT_REGULAR_PATH, 12)
                 subtitle_x = (img_width - subtitle_width) // 2
                 draw.text((subtitle_x, text_y_start + 25), subtitle, fill="gray", font=font_small)
             
@@ -166,58 +269,46 @@ class RealQRCodeGenerator:
         
         # 1. Address QR (for receiving payments)
         if wallet.get('address'):
-            qr = self.create_qr_code(wallet['address'])
-            img = self.create_styled_image(qr, style)
+            img = self.create_qr_image(wallet['address'], style)
             
             if with_labels:
                 img = self.add_label_to_image(img, "TRON Address", "For receiving payments")
             
             address_file = os.path.join(output_dir, f"wallet_{wallet_id}_address.png")
-            img.save(address_file)
+            img.save(address_file, format='PNG', compress_level=1, optimize=False)
             generated_files['address'] = address_file
         
         # 2. Private Key QR (for importing wallet)
         if wallet.get('private_key'):
-            qr = self.create_qr_code(wallet['private_key'], error_correction="H")  # Higher error correction for private keys
-            img = self.create_styled_image(qr, style)
+            img = self.create_qr_image(wallet['private_key'], style, error_correction="H")  # Higher error correction for private keys
             
             if with_labels:
                 img = self.add_label_to_image(img, "Private Key", "⚠️ Keep absolutely private!")
             
             private_key_file = os.path.join(output_dir, f"wallet_{wallet_id}_private_key.png")
-            img.save(private_key_file)
+            img.save(private_key_file, format='PNG', compress_level=1, optimize=False)
             generated_files['private_key'] = private_key_file
         
         # 3. Mnemonic QR (for wallet recovery)
         if wallet.get('mnemonic_phrase'):
-            qr = self.create_qr_code(wallet['mnemonic_phrase'], error_correction="H")
-            img = self.create_styled_image(qr, style)
+            img = self.create_qr_image(wallet['mnemonic_phrase'], style, error_correction="H")
             
             if with_labels:
                 img = self.add_label_to_image(img, "Mnemonic Phrase", "For wallet recovery")
             
             mnemonic_file = os.path.join(output_dir, f"wallet_{wallet_id}_mnemonic.png")
-            img.save(mnemonic_file)
+            img.save(mnemonic_file, format='PNG', compress_level=1, optimize=False)
             generated_files['mnemonic'] = mnemonic_file
         
         # 4. Complete wallet info JSON QR
-        wallet_info = {
-            'address': wallet.get('address'),
-            'privateKey': wallet.get('private_key'),
-            'mnemonic': wallet.get('mnemonic_phrase'),
-            'derivationPath': wallet.get('derivation_path'),
-            'network': 'mainnet'
-        }
-        
-        wallet_json = json.dumps(wallet_info, separators=(',', ':'))
-        qr = self.create_qr_code(wallet_json, error_correction="H")
-        img = self.create_styled_image(qr, style)
+        wallet_json = _complete_wallet_json(wallet)
+        img = self.create_qr_image(wallet_json, style, error_correction="H")
         
         if with_labels:
             img = self.add_label_to_image(img, "Complete Wallet", "Full import data")
         
         complete_file = os.path.join(output_dir, f"wallet_{wallet_id}_complete.png")
-        img.save(complete_file)
+        img.save(complete_file, format='PNG', compress_level=1, optimize=False)
         generated_files['complete'] = complete_file
         
         return generated_files
@@ -226,8 +317,7 @@ class RealQRCodeGenerator:
                           label: str = "", subtitle: str = "", error_correction: str = "M") -> str:
         """Generate a single QR code with custom data"""
         
-        qr = self.create_qr_code(data, error_correction=error_correction)
-        img = self.create_styled_image(qr, style)
+        img = self.create_qr_image(data, style, error_correction=error_correction)
         
         if label:
             img = self.add_label_to_image(img, label, subtitle)
@@ -235,38 +325,46 @@ class RealQRCodeGenerator:
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else ".", exist_ok=True)
         
-        img.save(output_file)
+        img.save(output_file, format='PNG', compress_level=1, optimize=False)
         return output_file
     
     def create_wallet_import_sheet(self, wallet_id: int, output_file: str = None) -> str:
         """Create a single image with multiple QR codes for wallet import"""
-        
+
         wallet = self.get_wallet_from_db(wallet_id)
         if not wallet:
             raise ValueError(f"Wallet {wallet_id} not found in database")
-        
+
         if not output_file:
             output_file = f"wallet_{wallet_id}_import_sheet.png"
-        
+
+        sheet = self._build_import_sheet(wallet_id, wallet)
+
+        # Ensure output directory exists
+        os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else ".", exist_ok=True)
+
+        sheet.save(output_file, format='PNG', compress_level=1, optimize=False)
+        return output_file
+
+    def _build_import_sheet(self, wallet_id: int, wallet: Dict) -> Image.Image:
+        """Compose the import-sheet image for an already-loaded wallet"""
+
         # Generate individual QR codes
         qr_codes = []
         labels = []
         
         if wallet.get('address'):
-            qr = self.create_qr_code(wallet['address'])
-            img = self.create_styled_image(qr, "rounded")
+            img = self.create_qr_image(wallet['address'], "rounded")
             qr_codes.append(img)
             labels.append("Address")
         
         if wallet.get('mnemonic_phrase'):
-            qr = self.create_qr_code(wallet['mnemonic_phrase'], error_correction="H")
-            img = self.create_styled_image(qr, "rounded")
+            img = self.create_qr_image(wallet['mnemonic_phrase'], "rounded", error_correction="H")
             qr_codes.append(img)
             labels.append("Mnemonic")
         
         if wallet.get('private_key'):
-            qr = self.create_qr_code(wallet['private_key'], error_correction="H")
-            img = self.create_styled_image(qr, "rounded")
+            img = self.create_qr_image(wallet['private_key'], "rounded", error_correction="H")
             qr_codes.append(img)
             labels.append("Private Key")
         
@@ -291,16 +389,11 @@ class RealQRCodeGenerator:
         draw = ImageDraw.Draw(sheet)
         
         # Add title
-        try:
-            title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
-            label_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-        except (OSError, IOError):
-            title_font = ImageFont.load_default()
-            label_font = ImageFont.load_default()
-        
+        title_font = _load_font(FONT_BOLD_PATH, 24)
+        label_font = _load_font(FONT_REGULAR_PATH, 14)
+
         title = f"TRON Wallet Import Sheet (ID: {wallet_id})"
-        title_bbox = draw.textbbox((0, 0), title, font=title_font)
-        title_width = title_bbox[2] - title_bbox[0]
+        title_width, _ = _text_size(title, FONT_BOLD_PATH, 24)
         title_x = (sheet_width - title_width) // 2
         draw.text((title_x, 20), title, fill="black", font=title_font)
         
@@ -316,16 +409,93 @@ class RealQRCodeGenerator:
             sheet.paste(qr_img, (x, y))
             
             # Add label
-            label_bbox = draw.textbbox((0, 0), label, font=label_font)
-            label_width = label_bbox[2] - label_bbox[0]
+            label_width, _ = _text_size(label, FONT_REGULAR_PATH, 14)
             label_x = x + (qr_size - label_width) // 2
             draw.text((label_x, y + qr_size + 5), label, fill="black", font=label_font)
-        
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else ".", exist_ok=True)
-        
-        sheet.save(output_file)
-        return output_file
+
+        return sheet
+
+    def create_sheets_bulk(self, wallet_ids: List[int], output_dir: str = "import_sheets") -> List[str]:
+        """Create import sheets for many wallets with a 3-stage pipeline
+
+        A reader thread loads wallets from the database, a small pool of
+        builder threads composes the sheet images, and a single writer
+        thread saves the PNGs, each stage connected by a bounded queue.
+        Overlapping the I/O-bound reads and writes with the CPU-bound QR
+        composition keeps all stages busy instead of running serially.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        wallets_q = queue.Queue(maxsize=4)
+        sheets_q = queue.Queue(maxsize=4)
+        written = []
+        errors = []
+
+        # Every stage catches its own failures and records them in
+        # errors, and the reader's sentinel goes out even if it dies —
+        # a crashed stage must never leave the others blocked on the
+        # bounded queues
+        def _db_reader():
+            try:
+                wallets = self.get_wallets(wallet_ids)
+                for wallet_id in wallet_ids:
+                    wallet = wallets.get(wallet_id)
+                    if wallet:
+                        wallets_q.put((wallet_id, wallet))
+                    else:
+                        errors.append(f"Wallet {wallet_id} not found in database")
+            except Exception as e:
+                errors.append(f"Database read failed: {e}")
+            finally:
+                wallets_q.put(None)
+
+        def _qr_builder():
+            while True:
+                item = wallets_q.get()
+                if item is None:
+                    # Re-queue the sentinel so sibling builders stop too
+                    wallets_q.put(None)
+                    break
+                wallet_id, wallet = item
+                try:
+                    sheets_q.put((wallet_id, self._build_import_sheet(wallet_id, wallet)))
+                except Exception as e:
+                    errors.append(f"Wallet {wallet_id}: sheet build failed: {e}")
+
+        def _png_writer():
+            while True:
+                item = sheets_q.get()
+                if item is None:
+                    break
+                wallet_id, sheet = item
+                output_file = os.path.join(output_dir, f"wallet_{wallet_id}_import_sheet.png")
+                try:
+                    sheet.save(output_file, format='PNG', compress_level=1, optimize=False)
+                except Exception as e:
+                    errors.append(f"Wallet {wallet_id}: failed to write {output_file}: {e}")
+                else:
+                    written.append(output_file)
+
+        reader = threading.Thread(target=_db_reader)
+        writer = threading.Thread(target=_png_writer)
+        builders = [threading.Thread(target=_qr_builder)
+                    for _ in range(min(4, os.cpu_count() or 1))]
+
+        reader.start()
+        writer.start()
+        for builder in builders:
+            builder.start()
+
+        reader.join()
+        for builder in builders:
+            builder.join()
+        sheets_q.put(None)
+        writer.join()
+
+        for error in errors:
+            print(f"❌ {error}")
+
+        return written
 
 def main():
     if not QR_AVAILABLE:
@@ -338,6 +508,7 @@ def main():
     data_group = parser.add_mutually_exclusive_group(required=True)
     data_group.add_argument('--data', help='Raw data to encode in QR code')
     data_group.add_argument('--wallet-id', type=int, help='Wallet ID from database')
+    data_group.add_argument('--wallet-ids', help='Comma-separated wallet IDs for bulk import sheets')
     data_group.add_argument('--address', help='TRON address to encode')
     data_group.add_argument('--mnemonic', help='Mnemonic phrase to encode')
     data_group.add_argument('--private-key', help='Private key to encode')
@@ -366,7 +537,14 @@ def main():
     generator = RealQRCodeGenerator(args.db_path)
     
     try:
-        if args.wallet_id:
+        if args.wallet_ids:
+            wallet_ids = [int(wallet_id) for wallet_id in args.wallet_ids.split(',')]
+            sheet_files = generator.create_sheets_bulk(wallet_ids, args.output_dir)
+            print(f"Created {len(sheet_files)} import sheets:")
+            for sheet_file in sheet_files:
+                print(f"  {sheet_file}")
+
+        elif args.wallet_id:
             if args.import_sheet:
                 # Create import sheet
                 sheet_file = args.output or f"wallet_{args.wallet_id}_import_sheet.png"
@@ -395,12 +573,7 @@ def main():
                         'address': wallet.get('address'),
                         'private_key': wallet.get('private_key'),
                         'mnemonic': wallet.get('mnemonic_phrase'),
-                        'complete': json.dumps({
-                            'address': wallet.get('address'),
-                            'privateKey': wallet.get('private_key'),
-                            'mnemonic': wallet.get('mnemonic_phrase'),
-                            'derivationPath': wallet.get('derivation_path')
-                        })
+                        'complete': _complete_wallet_json(wallet)
                     }
                     
                     data = data_map.get(args.type)
@@ -13,41 +13,52 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import sqlite3
 import sys
+from contextlib import closing
 from typing import Dict, Optional
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+@functools.lru_cache(maxsize=1024)
 def create_text_qr(data: str, border: int = 2) -> str:
-    """Create a simple text-based QR code representation"""
+    """Create a simple text-based QR code representation
+
+    Pure function of (data, border), so results are memoized for the
+    process — batch runs that repeat addresses or mnemonics skip the
+    formatting work entirely.
+    """
     # This is a simplified QR code representation using ASCII
     # For actual QR codes, use the qrcode library
     
-    lines = []
-    
-    # Add border
-    for _ in range(border):
-        lines.append("█" * (len(data) + 2 * border + 4))
-    
-    # Add data representation
-    lines.append("█" + " " * (border + 1) + "QR CODE" + " " * (border + 1) + "█")
-    lines.append("█" + " " * (len(data) + 2 * border + 2) + "█")
-    
-    # Split data into chunks and create visual representation
+    # Build each fixed-width piece once instead of recomputing per row
     chunk_size = 20
+    inner_width = len(data) + 2 * border + 2
+
+    border_line = "█" * (inner_width + 2)
+    blank_line = "█" + " " * inner_width + "█"
+    padding = " " * (border + 1)
+    title_line = f"█{padding}QR CODE{padding}█"
+
+    # Split data into chunks and create visual representation
     data_chunks = [data[i:i+chunk_size] for i in range(0, len(data), chunk_size)]
-    
-    for chunk in data_chunks:
-        padding = " " * (border + 1)
-        line = "█" + padding + chunk.ljust(chunk_size) + padding + "█"
-        lines.append(line)
-    
-    lines.append("█" + " " * (len(data) + 2 * border + 2) + "█")
-    
-    # Add border
-    for _ in range(border):
-        lines.append("█" * (len(data) + 2 * border + 4))
-    
+    data_lines = [f"█{padding}{chunk:<{chunk_size}}{padding}█" for chunk in data_chunks]
+
+    lines = (
+        [border_line] * border
+        + [title_line, blank_line, *data_lines, blank_line]
+        + [border_line] * border
+    )
+
     return "\n".join(lines)
 
 def create_wallet_qr_info(wallet: Dict) -> Dict[str, str]:
@@ -73,25 +84,19 @@ def create_wallet_qr_info(wallet: Dict) -> Dict[str, str]:
         'mnemonic': wallet.get('mnemonic_phrase'),
         'derivationPath': wallet.get('derivation_path')
     }
-    qr_data['complete'] = json.dumps(wallet_json, separators=(',', ':'))
+    qr_data['complete'] = _json_dumps(wallet_json)
     
     return qr_data
 
 def get_wallet_from_db(wallet_id: int, db_path: str = "mnemonic_wallets.db") -> Optional[Dict]:
     """Get wallet data from database"""
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM wallets WHERE id = ?', (wallet_id,))
-        row = cursor.fetchone()
-        
-        if row:
-            columns = [description[0] for description in cursor.description]
-            return dict(zip(columns, row))
-        
-        conn.close()
-        return None
+        # closing() so the connection is released on every path — the old
+        # code returned before its conn.close() and leaked the handle
+        with closing(sqlite3.connect(db_path)) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute('SELECT * FROM wallets WHERE id = ?', (wallet_id,)).fetchone()
+            return dict(row) if row else None
     except sqlite3.Error:
         return None
 
@@ -112,7 +117,7 @@ def generate_import_urls(wallet: Dict) -> Dict[str, str]:
             'privateKey': wallet['private_key'],
             'network': 'mainnet'
         }
-        urls['generic'] = f"wallet://import?data={json.dumps(generic_data)}"
+        urls['generic'] = f"wallet://import?data={_json_dumps(generic_data)}"
     
     return urls
 
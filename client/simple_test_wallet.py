@@ -5,8 +5,9 @@ Simple test wallet creation
 
 import sqlite3
 
-# Create database and table
+# Create database and table — one connection for the whole run
 conn = sqlite3.connect("test_wallet.db")
+conn.execute('PRAGMA journal_mode=WAL')
 cursor = conn.cursor()
 
 # Create table
@@ -36,14 +37,11 @@ cursor.execute('''
 
 conn.commit()
 wallet_id = cursor.lastrowid
-conn.close()
 
 print(f"Test wallet created with ID: {wallet_id}")
 print("Verifying...")
 
-# Verify
-conn = sqlite3.connect("test_wallet.db")
-cursor = conn.cursor()
+# Verify on the same connection
 cursor.execute("SELECT * FROM wallets WHERE id = ?", (wallet_id,))
 result = cursor.fetchone()
 conn.close()
@@ -18,25 +18,67 @@ Usage:
 
 import os
 import json
+import queue
 import sqlite3
 import hashlib
+import hmac
 import secrets
+from hashlib import sha256, sha3_256
 import argparse
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import base58
 
 # TRON-specific constants
 TRON_ADDRESS_PREFIX = 0x41
 TRON_MAINNET_PREFIX = "T"
 
+_b58encode = base58.b58encode
+
+# 256-entry base58 digit table: alphabet byte -> value, 0xFF marks invalid.
+# Lets whole addresses be mapped to digit values with one bytes.translate
+# call instead of per-character Python lookups.
+_B58_ALPHABET = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+_B58_DECODE_TABLE = bytes(
+    _B58_ALPHABET.index(byte) if byte in _B58_ALPHABET else 0xFF
+    for byte in range(256)
+)
+
 class TronAddressGenerator:
     """Generate and manage TRON addresses for payment processing"""
     
-    def __init__(self, db_path: str = "tron_addresses.db"):
+    def __init__(self, db_path: str = "tron_addresses.db", pool_size: int = 4):
         self.db_path = db_path
         self.init_database()
-    
+
+        # Reuse connections across calls instead of reopening the database
+        # (and its -wal/-shm files) for every method invocation
+        self._pool = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        self._write_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a database connection with WAL and batch-friendly pragmas"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA cache_size=-64000')
+        return conn
+
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled connection for the duration of a call"""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
     def init_database(self):
         """Initialize SQLite database for storing addresses"""
         conn = sqlite3.connect(self.db_path)
@@ -46,8 +88,8 @@ class TronAddressGenerator:
             CREATE TABLE IF NOT EXISTS addresses (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 address TEXT UNIQUE NOT NULL,
-                private_key TEXT NOT NULL,
-                public_key TEXT NOT NULL,
+                private_key BLOB NOT NULL,
+                public_key BLOB NOT NULL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 label TEXT,
                 is_used BOOLEAN DEFAULT FALSE,
@@ -72,13 +114,30 @@ class TronAddressGenerator:
             )
         ''')
         
-        cursor.execute('''
+        # executescript, not execute: sqlite3 runs only the first statement
+        # of a multi-statement string, so these indexes were never created
+        cursor.executescript('''
             CREATE INDEX IF NOT EXISTS idx_addresses_address ON addresses(address);
             CREATE INDEX IF NOT EXISTS idx_addresses_used ON addresses(is_used);
             CREATE INDEX IF NOT EXISTS idx_payments_address ON payments(address);
             CREATE INDEX IF NOT EXISTS idx_payments_status ON payments(status);
+            CREATE INDEX IF NOT EXISTS idx_addresses_unused_created
+                ON addresses(created_at)
+                WHERE is_used = 0;
         ''')
-        
+
+        # Migrate legacy rows that stored keys as hex TEXT to raw BLOBs
+        legacy = cursor.execute('''
+            SELECT id, private_key, public_key FROM addresses
+            WHERE typeof(private_key) = 'text'
+        ''').fetchall()
+        if legacy:
+            cursor.executemany(
+                'UPDATE addresses SET private_key = ?, public_key = ? WHERE id = ?',
+                [(bytes.fromhex(private_key), bytes.fromhex(public_key), row_id)
+                 for row_id, private_key, public_key in legacy]
+            )
+
         conn.commit()
         conn.close()
     
@@ -106,27 +165,20 @@ class TronAddressGenerator:
         seed = hmac.new(b"tron_secp256k1", private_key, hashlib.sha256).digest()
         return seed[:33]  # Compressed public key format
     
-    def public_key_to_address(self, public_key: bytes) -> str:
-        """Convert public key to TRON address"""
-        # Hash the public key
-        hash1 = hashlib.sha3_256(public_key).digest()
-        
-        # Take last 20 bytes
-        address_bytes = hash1[-20:]
-        
-        # Add TRON prefix
-        address_with_prefix = bytes([TRON_ADDRESS_PREFIX]) + address_bytes
-        
-        # Calculate checksum
-        hash2 = hashlib.sha256(address_with_prefix).digest()
-        hash3 = hashlib.sha256(hash2).digest()
-        checksum = hash3[:4]
-        
-        # Combine address and checksum
-        full_address = address_with_prefix + checksum
-        
-        # Encode in base58
-        return base58.b58encode(full_address).decode('utf-8')
+    def public_key_to_address(self, public_key: bytes,
+                              _sha3=sha3_256, _sha256=sha256, _b58=_b58encode) -> str:
+        """Convert public key to TRON address
+
+        The hash and encode callables are bound as defaults so the per-call
+        cost is a LOAD_FAST rather than a global/attribute lookup chain.
+        """
+        # Prefix + last 20 bytes of the public key hash
+        body = bytes((TRON_ADDRESS_PREFIX,)) + _sha3(public_key).digest()[-20:]
+
+        # Base58Check: double-SHA256 checksum over the prefixed body
+        checksum = _sha256(_sha256(body).digest()).digest()[:4]
+
+        return _b58(body + checksum).decode('ascii')
     
     def generate_address(self, label: Optional[str] = None) -> Dict[str, str]:
         """Generate a new TRON address with private key"""
@@ -138,36 +190,114 @@ class TronAddressGenerator:
         
         # Generate address
         address = self.public_key_to_address(public_key)
-        
-        # Convert to hex strings for storage
-        private_key_hex = private_key.hex()
-        public_key_hex = public_key.hex()
-        
+
+        # Keys stay raw bytes end to end; they land in BLOB columns
         return {
             'address': address,
-            'private_key': private_key_hex,
-            'public_key': public_key_hex,
+            'private_key': private_key,
+            'public_key': public_key,
             'label': label or f"Generated_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         }
     
-    def store_address(self, address_data: Dict[str, str]) -> bool:
-        """Store generated address in database"""
+    def validate_addresses_bulk(self, addresses: List[str]) -> List[bool]:
+        """Check many base58check addresses, one translate call per address
+
+        Each address is mapped through the precomputed digit table in C,
+        rejected early on bad length, prefix, or alphabet, and only then
+        pays the big-integer reconstruction and checksum compare. Useful
+        for screening externally supplied address lists before bulk
+        inserts.
+        """
+        _table = _B58_DECODE_TABLE
+        _sha256 = sha256
+
+        results = []
+        append = results.append
+        for address in addresses:
+            raw = address.encode('ascii', 'replace')
+            if len(raw) != 34 or not address.startswith(TRON_MAINNET_PREFIX):
+                append(False)
+                continue
+
+            digits = raw.translate(_table)
+            if 0xFF in digits:
+                append(False)
+                continue
+
+            acc = 0
+            for value in digits:
+                acc = acc * 58 + value
+            decoded = acc.to_bytes(25, 'big')
+
+            append(decoded[0] == TRON_ADDRESS_PREFIX and
+                   _sha256(_sha256(decoded[:-4]).digest()).digest()[:4] == decoded[-4:])
+
+        return results
+
+    def generate_address_batch(self, labels: List[str]) -> List[Dict[str, str]]:
+        """Generate one address per label with the hot-path names bound once
+
+        Per-call global and attribute lookups dominate the pure-Python
+        cost at large counts, so the key derivation and Base58Check steps
+        are inlined here against local bindings.
+        """
+        _hmac_new = hmac.new
+        _sha3 = sha3_256
+        _sha256 = sha256
+        _b58encode = base58.b58encode
+        _prefix = bytes((TRON_ADDRESS_PREFIX,))
+
+        # One getrandom syscall for the whole batch instead of one per key
+        key_material = memoryview(os.urandom(32 * len(labels)))
+
+        batch = []
+        append = batch.append
+        for i, label in enumerate(labels):
+            private_key = key_material[i * 32:(i + 1) * 32].tobytes()
+            # Same simplified demo derivation as private_key_to_public_key
+            public_key = _hmac_new(b"tron_secp256k1", private_key, _sha256).digest()[:33]
+            body = _prefix + _sha3(public_key).digest()[-20:]
+            checksum = _sha256(_sha256(body).digest()).digest()[:4]
+            append({
+                'address': _b58encode(body + checksum).decode('ascii'),
+                'private_key': private_key,
+                'public_key': public_key,
+                'label': label
+            })
+
+        return batch
+
+    def store_address(self, address_data: Dict[str, str], cursor: Optional[sqlite3.Cursor] = None) -> bool:
+        """Store generated address in database
+
+        When a cursor is passed the insert joins the caller's transaction;
+        otherwise a short-lived connection is opened and committed.
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO addresses (address, private_key, public_key, label)
-                VALUES (?, ?, ?, ?)
-            ''', (
-                address_data['address'],
-                address_data['private_key'],
-                address_data['public_key'],
-                address_data['label']
-            ))
-            
-            conn.commit()
-            conn.close()
+            if cursor is not None:
+                cursor.execute('''
+                    INSERT INTO addresses (address, private_key, public_key, label)
+                    VALUES (?, ?, ?, ?)
+                ''', (
+                    address_data['address'],
+                    address_data['private_key'],
+                    address_data['public_key'],
+                    address_data['label']
+                ))
+                return True
+
+            with self._write_lock, self._conn() as conn:
+                conn.execute('''
+                    INSERT INTO addresses (address, private_key, public_key, label)
+                    VALUES (?, ?, ?, ?)
+                ''', (
+                    address_data['address'],
+                    address_data['private_key'],
+                    address_data['public_key'],
+                    address_data['label']
+                ))
+
+                conn.commit()
             return True
         except sqlite3.IntegrityError:
             # Address already exists
@@ -175,44 +305,77 @@ class TronAddressGenerator:
         except Exception as e:
             print(f"Error storing address: {e}")
             return False
-    
+
     def generate_and_store_addresses(self, count: int, label_prefix: str = "Generated") -> List[Dict[str, str]]:
-        """Generate multiple addresses and store them"""
+        """Generate multiple addresses and store them in one transaction
+
+        The whole batch goes through a single executemany and a single
+        commit, so the per-insert connect/fsync cycle is paid once for the
+        run instead of once per address.
+        """
         generated = []
-        
-        for i in range(count):
-            label = f"{label_prefix}_{i+1:03d}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            address_data = self.generate_address(label)
-            
-            if self.store_address(address_data):
-                generated.append(address_data)
-                print(f"✅ Generated address {i+1}/{count}: {address_data['address']}")
-            else:
-                print(f"❌ Failed to generate address {i+1}/{count}")
-        
+
+        with self._write_lock, self._conn() as conn:
+            while len(generated) < count:
+                # One clock read per batch — the second-resolution suffix is
+                # identical for every label anyway
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                labels = [
+                    f"{label_prefix}_{len(generated)+i+1:03d}_{timestamp}"
+                    for i in range(count - len(generated))
+                ]
+                batch = self.generate_address_batch(labels)
+
+                rows = [(a['address'], a['private_key'], a['public_key'], a['label'])
+                        for a in batch]
+
+                with conn:
+                    cursor = conn.executemany('''
+                        INSERT OR IGNORE INTO addresses (address, private_key, public_key, label)
+                        VALUES (?, ?, ?, ?)
+                    ''', rows)
+
+                if cursor.rowcount == len(rows):
+                    generated.extend(batch)
+                else:
+                    # Rare collision with an existing address: keep only the
+                    # rows that landed (their fresh labels are in the table)
+                    # and regenerate the shortfall on the next pass
+                    placeholders = ','.join('?' * len(batch))
+                    stored_labels = {row[0] for row in conn.execute(
+                        f'SELECT label FROM addresses WHERE label IN ({placeholders})',
+                        [a['label'] for a in batch]
+                    )}
+                    generated.extend(a for a in batch if a['label'] in stored_labels)
+
+            # Refresh planner statistics so the partial unused-address
+            # index gets picked after a large insert
+            conn.execute('ANALYZE addresses')
+
+        for i, address_data in enumerate(generated, 1):
+            print(f"✅ Generated address {i}/{count}: {address_data['address']}")
+
         return generated
     
     def get_unused_address(self) -> Optional[Dict[str, str]]:
         """Get an unused address from the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT address, private_key, public_key, label, created_at
-            FROM addresses
-            WHERE is_used = FALSE
-            ORDER BY created_at ASC
-            LIMIT 1
-        ''')
-        
-        result = cursor.fetchone()
-        conn.close()
-        
+        with self._conn() as conn:
+            cursor = conn.execute('''
+                SELECT address, private_key, public_key, label, created_at
+                FROM addresses
+                WHERE is_used = FALSE
+                ORDER BY created_at ASC
+                LIMIT 1
+            ''')
+
+            result = cursor.fetchone()
+
         if result:
             return {
                 'address': result[0],
-                'private_key': result[1],
-                'public_key': result[2],
+                # Hex only at the display boundary; storage is raw bytes
+                'private_key': result[1].hex() if isinstance(result[1], bytes) else result[1],
+                'public_key': result[2].hex() if isinstance(result[2], bytes) else result[2],
                 'label': result[3],
                 'created_at': result[4]
             }
@@ -220,145 +383,166 @@ class TronAddressGenerator:
     
     def mark_address_used(self, address: str) -> bool:
         """Mark an address as used"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE addresses
-            SET is_used = TRUE
-            WHERE address = ?
-        ''', (address,))
-        
-        success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        with self._write_lock, self._conn() as conn:
+            cursor = conn.execute('''
+                UPDATE addresses
+                SET is_used = TRUE
+                WHERE address = ?
+            ''', (address,))
+
+            success = cursor.rowcount > 0
+            conn.commit()
         return success
     
-    def list_addresses(self, include_used: bool = True) -> List[Dict[str, str]]:
-        """List all addresses in the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+    def iter_addresses(self, include_used: bool = True) -> Iterator[Dict[str, str]]:
+        """Yield addresses one at a time, streaming from the cursor
+
+        The pooled connection is held only while the iterator is being
+        consumed; memory stays flat however many addresses exist.
+        """
         query = '''
             SELECT address, label, created_at, is_used, balance_usdt, payment_count
             FROM addresses
         '''
-        
+
         if not include_used:
             query += ' WHERE is_used = FALSE'
-        
+
         query += ' ORDER BY created_at DESC'
-        
-        cursor.execute(query)
-        results = cursor.fetchall()
-        conn.close()
-        
-        addresses = []
-        for result in results:
-            addresses.append({
-                'address': result[0],
-                'label': result[1],
-                'created_at': result[2],
-                'is_used': bool(result[3]),
-                'balance_usdt': result[4],
-                'payment_count': result[5]
-            })
-        
-        return addresses
+
+        with self._conn() as conn:
+            for row in conn.execute(query):
+                yield {
+                    'address': row[0],
+                    'label': row[1],
+                    'created_at': row[2],
+                    'is_used': bool(row[3]),
+                    'balance_usdt': row[4],
+                    'payment_count': row[5]
+                }
+
+    def list_addresses(self, include_used: bool = True) -> List[Dict[str, str]]:
+        """List all addresses in the database"""
+        return list(self.iter_addresses(include_used))
     
-    def export_addresses(self, format_type: str = "json", filename: Optional[str] = None) -> str:
-        """Export addresses to file"""
-        addresses = self.list_addresses()
-        
+    def export_addresses(self, format_type: str = "json", filename: Optional[str] = None,
+                         indent: Optional[int] = None) -> str:
+        """Export addresses to file, streaming rows straight from the cursor
+
+        Rows are written as they come off the cursor instead of being
+        materialized as a list of dicts first, so memory stays flat for
+        large databases. JSON defaults to compact output; pass indent for
+        a human-readable file.
+        """
         if not filename:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"tron_addresses_{timestamp}.{format_type}"
-        
-        if format_type.lower() == "json":
-            with open(filename, 'w') as f:
-                json.dump(addresses, f, indent=2)
-        elif format_type.lower() == "csv":
-            import csv
-            with open(filename, 'w', newline='') as f:
-                if addresses:
-                    writer = csv.DictWriter(f, fieldnames=addresses[0].keys())
-                    writer.writeheader()
-                    writer.writerows(addresses)
-        else:
-            raise ValueError(f"Unsupported format: {format_type}")
-        
+
+        columns = ['address', 'label', 'created_at', 'is_used', 'balance_usdt', 'payment_count']
+        query = '''
+            SELECT address, label, created_at, is_used, balance_usdt, payment_count
+            FROM addresses
+            ORDER BY created_at DESC
+        '''
+
+        with self._conn() as conn:
+            cursor = conn.execute(query)
+
+            if format_type.lower() == "json":
+                with open(filename, 'w') as f:
+                    f.write('[')
+                    first = True
+                    for row in cursor:
+                        record = dict(zip(columns, row))
+                        record['is_used'] = bool(record['is_used'])
+                        if not first:
+                            f.write(',')
+                        if indent is None:
+                            f.write(json.dumps(record, separators=(',', ':')))
+                        else:
+                            f.write(json.dumps(record, indent=indent))
+                        first = False
+                    f.write(']')
+            elif format_type.lower() == "csv":
+                import csv
+                with open(filename, 'w', newline='') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(columns)
+                    # The cursor already yields tuples — no per-row dicts
+                    writer.writerows(cursor)
+            else:
+                raise ValueError(f"Unsupported format: {format_type}")
+
         return filename
     
     def create_payment_request(self, amount: float, order_id: str, label: Optional[str] = None) -> Optional[Dict[str, str]]:
-        """Create a payment request using an unused address"""
-        address_data = self.get_unused_address()
-        
-        if not address_data:
-            print("❌ No unused addresses available. Generate more addresses first.")
-            return None
-        
-        # Store payment request
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO payments (address, expected_amount, order_id)
-            VALUES (?, ?, ?)
-        ''', (address_data['address'], amount, order_id))
-        
-        payment_id = cursor.lastrowid
-        
-        # Mark address as used
-        self.mark_address_used(address_data['address'])
-        
-        conn.commit()
-        conn.close()
-        
+        """Create a payment request by atomically claiming an unused address"""
+        with self._write_lock, self._conn() as conn:
+            with conn:
+                # Claim the oldest unused address and read it back in one
+                # statement, so a concurrent caller can never be handed the
+                # same address between the lookup and the flag update
+                row = conn.execute('''
+                    UPDATE addresses
+                    SET is_used = TRUE
+                    WHERE id = (
+                        SELECT id FROM addresses
+                        WHERE is_used = FALSE
+                        ORDER BY created_at ASC
+                        LIMIT 1
+                    )
+                    RETURNING address, label
+                ''').fetchone()
+
+                if row is None:
+                    print("❌ No unused addresses available. Generate more addresses first.")
+                    return None
+
+                address, address_label = row
+
+                cursor = conn.execute('''
+                    INSERT INTO payments (address, expected_amount, order_id)
+                    VALUES (?, ?, ?)
+                ''', (address, amount, order_id))
+
+                payment_id = cursor.lastrowid
+
         return {
             'payment_id': str(payment_id),
-            'address': address_data['address'],
+            'address': address,
             'expected_amount': amount,
             'order_id': order_id,
-            'label': label or address_data['label']
+            'label': label or address_label
         }
     
     def get_statistics(self) -> Dict[str, int]:
         """Get statistics about addresses and payments"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Address statistics
-        cursor.execute('SELECT COUNT(*) FROM addresses')
-        total_addresses = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM addresses WHERE is_used = TRUE')
-        used_addresses = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM addresses WHERE is_used = FALSE')
-        unused_addresses = cursor.fetchone()[0]
-        
-        # Payment statistics
-        cursor.execute('SELECT COUNT(*) FROM payments')
-        total_payments = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM payments WHERE status = "completed"')
-        completed_payments = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM payments WHERE status = "pending"')
-        pending_payments = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT SUM(received_amount) FROM payments WHERE status = "completed"')
-        total_received = cursor.fetchone()[0] or 0.0
-        
-        conn.close()
-        
+        with self._conn() as conn:
+            # Conditional aggregation: one pass over each table instead of
+            # a separate COUNT query per statistic
+            total_addresses, used_addresses, unused_addresses = conn.execute('''
+                SELECT COUNT(*),
+                       SUM(CASE WHEN is_used THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN NOT is_used THEN 1 ELSE 0 END)
+                FROM addresses
+            ''').fetchone()
+
+            total_payments, completed_payments, pending_payments, total_received = conn.execute('''
+                SELECT COUNT(*),
+                       SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END),
+                       COALESCE(SUM(CASE WHEN status = 'completed' THEN received_amount END), 0.0)
+                FROM payments
+            ''').fetchone()
+        
+        # SUM over an empty table yields NULL
         return {
             'total_addresses': total_addresses,
-            'used_addresses': used_addresses,
-            'unused_addresses': unused_addresses,
+            'used_addresses': used_addresses or 0,
+            'unused_addresses': unused_addresses or 0,
             'total_payments': total_payments,
-            'completed_payments': completed_payments,
-            'pending_payments': pending_payments,
+            'completed_payments': completed_payments or 0,
+            'pending_payments': pending_payments or 0,
             'total_received_usdt': total_received
         }
 
@@ -407,14 +591,15 @@ def main():
         print(f"✅ Successfully generated {len(generated)} addresses")
     
     elif args.command == 'list':
-        addresses = generator.list_addresses(include_used=not args.unused_only)
-        if addresses:
-            print(f"\n📋 {'Unused ' if args.unused_only else ''}Addresses:")
-            print("-" * 80)
-            for addr in addresses:
-                status = "🔴 Used" if addr['is_used'] else "🟢 Available"
-                print(f"{addr['address']} | {addr['label']} | {status} | Created: {addr['created_at']}")
-        else:
+        found = False
+        for addr in generator.iter_addresses(include_used=not args.unused_only):
+            if not found:
+                print(f"\n📋 {'Unused ' if args.unused_only else ''}Addresses:")
+                print("-" * 80)
+                found = True
+            status = "🔴 Used" if addr['is_used'] else "🟢 Available"
+            print(f"{addr['address']} | {addr['label']} | {status} | Created: {addr['created_at']}")
+        if not found:
             print("No addresses found.")
     
     elif args.command == 'export':
@@ -9,7 +9,8 @@ import os
 import json
 import sqlite3
 import hashlib
-import secrets
+import multiprocessing
+import threading
 import argparse
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
@@ -24,6 +25,86 @@ except ImportError:
     print("   Install with: pip install base58 ecdsa")
     print("   Falling back to demonstration mode (NOT SECURE)")
 
+try:
+    import orjson
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+try:
+    # libsecp256k1 binding — C scalar multiplication instead of the
+    # pure-Python ecdsa package, orders of magnitude faster per key
+    import coincurve
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    COINCURVE_AVAILABLE = False
+
+# Keccak backend resolved once at import time instead of per address;
+# pycryptodome's C implementation is preferred, pysha3 is the fallback
+try:
+    from Crypto.Hash import keccak as _keccak
+
+    def _keccak256(data: bytes) -> bytes:
+        return _keccak.new(digest_bits=256, data=data).digest()
+except ImportError:
+    try:
+        import sha3
+
+        def _keccak256(data: bytes) -> bytes:
+            return sha3.keccak_256(data).digest()
+    except ImportError:
+        def _keccak256(data: bytes) -> bytes:
+            raise ImportError("Keccak backend required: pip install pycryptodome or pysha3")
+
+_TRON_PREFIX = b'\x41'
+_urandom = os.urandom
+_B58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+_B58_SET = frozenset(_B58_ALPHABET)
+
+def _b58encode25(data: bytes) -> str:
+    """Base58-encode exactly 25 bytes (prefixed TRON address + checksum)
+
+    The generic encoder copes with arbitrary lengths and leading zeros;
+    a 0x41-prefixed 25-byte payload always encodes to exactly 34
+    characters, so this is one int conversion and an unrolled divmod
+    loop into a fixed-size buffer.
+    """
+    num = int.from_bytes(data, 'big')
+    alphabet = _B58_ALPHABET
+    chars = [''] * 34
+    for i in range(33, -1, -1):
+        num, rem = divmod(num, 58)
+        chars[i] = alphabet[rem]
+    return ''.join(chars)
+
+def _pubkey_to_address(public_key: bytes, _keccak=_keccak256, _sha256=hashlib.sha256) -> str:
+    """Fused Keccak -> prefix -> double-SHA256 -> base58 pipeline
+
+    Single flat function with bound callables so bulk generation pays one
+    call per address for the whole bit-pushing sequence.
+    """
+    core = _TRON_PREFIX + _keccak(public_key)[-20:]
+    return _b58encode25(core + _sha256(_sha256(core).digest()).digest()[:4])
+
+# Lazily-built per-process worker for multiprocessing generation; __new__
+# skips __init__ so worker processes never touch the database
+_worker_generator = None
+
+def _gen_one(job: Tuple[str, bytes]) -> Dict[str, str]:
+    """Generate one address in a worker process (top-level, so picklable)
+
+    The private key is drawn in the parent from a single bulk urandom
+    read, so workers only do the expensive curve and hash work.
+    """
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = TronAddressGeneratorSecure.__new__(TronAddressGeneratorSecure)
+    label, private_key = job
+    return _worker_generator._generate_with_key(private_key, label)
+
 class TronAddressGeneratorSecure:
     """Production-grade TRON address generator with proper cryptography"""
     
@@ -32,13 +113,26 @@ class TronAddressGeneratorSecure:
         if not CRYPTO_AVAILABLE:
             print("❌ Cannot run in secure mode without cryptography libraries")
             raise ImportError("Required libraries: base58, ecdsa")
+        # One connection for the instance lifetime: opening the file and
+        # warming the page cache per call cost more than the queries here.
+        # The RLock serializes access so methods may call each other.
+        # cached_statements keeps the bulk-path INSERT/UPDATE/SELECT
+        # strings compiled across calls instead of re-parsing the SQL
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     cached_statements=256)
+        self._lock = threading.RLock()
+        # WAL keeps readers unblocked and makes the batched commits cheap
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        self._conn.execute('PRAGMA cache_size=-65536')
         self.init_database()
-    
+
     def init_database(self):
         """Initialize SQLite database for storing addresses"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
-        
+
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS addresses (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -51,8 +145,7 @@ class TronAddressGeneratorSecure:
                 balance_usdt REAL DEFAULT 0.0,
                 last_checked TIMESTAMP,
                 payment_count INTEGER DEFAULT 0,
-                derivation_path TEXT,
-                checksum TEXT
+                derivation_path TEXT
             )
         ''')
         
@@ -73,76 +166,78 @@ class TronAddressGeneratorSecure:
             )
         ''')
         
-        cursor.execute('''
+        # executescript: sqlite3's execute only accepts a single statement
+        cursor.executescript('''
             CREATE INDEX IF NOT EXISTS idx_addresses_address ON addresses(address);
             CREATE INDEX IF NOT EXISTS idx_addresses_used ON addresses(is_used);
+            CREATE INDEX IF NOT EXISTS idx_addr_unused_created
+                ON addresses(is_used, created_at) WHERE is_used = FALSE;
             CREATE INDEX IF NOT EXISTS idx_payments_address ON payments(address);
             CREATE INDEX IF NOT EXISTS idx_payments_status ON payments(status);
             CREATE INDEX IF NOT EXISTS idx_payments_order_id ON payments(order_id);
         ''')
-        
+
         conn.commit()
-        conn.close()
-    
+
     def generate_private_key(self) -> bytes:
         """Generate a cryptographically secure private key"""
-        return secrets.token_bytes(32)
+        # secrets.token_bytes is just os.urandom plus a Python frame;
+        # call the bound kernel CSPRNG directly
+        return _urandom(32)
     
     def private_key_to_public_key(self, private_key: bytes) -> bytes:
-        """Convert private key to public key using proper ECDSA"""
+        """Convert private key to compressed public key using proper ECDSA"""
+        if COINCURVE_AVAILABLE:
+            return coincurve.PublicKey.from_valid_secret(private_key).format(compressed=True)
         sk = SigningKey.from_string(private_key, curve=SECP256k1)
         vk = sk.verifying_key
         return vk.to_string("compressed")
-    
+
+    def _derive_key_pair(self, private_key: bytes) -> Tuple[bytes, bytes]:
+        """Return (compressed public key, uncompressed 64-byte X||Y) for a secret"""
+        if COINCURVE_AVAILABLE:
+            pub = coincurve.PublicKey.from_valid_secret(private_key)
+            return pub.format(compressed=True), pub.format(compressed=False)[1:]
+        vk = SigningKey.from_string(private_key, curve=SECP256k1).verifying_key
+        return vk.to_string("compressed"), vk.to_string()
+
     def public_key_to_address(self, public_key: bytes) -> str:
-        """Convert public key to TRON address"""
-        # Use Keccak-256 hash (same as Ethereum)
-        import sha3
-        keccak = sha3.keccak_256()
-        keccak.update(public_key[1:])  # Remove the 0x04 prefix for uncompressed keys
-        hash_result = keccak.digest()
-        
-        # Take last 20 bytes
-        address_bytes = hash_result[-20:]
-        
-        # Add TRON prefix (0x41)
-        address_with_prefix = bytes([0x41]) + address_bytes
-        
-        # Calculate checksum
-        hash1 = hashlib.sha256(address_with_prefix).digest()
-        hash2 = hashlib.sha256(hash1).digest()
-        checksum = hash2[:4]
-        
-        # Combine address and checksum
-        full_address = address_with_prefix + checksum
-        
-        # Encode in base58
-        return base58.b58encode(full_address).decode('utf-8')
+        """Convert an uncompressed public key (64-byte X||Y) to a TRON address"""
+        if len(public_key) == 65:
+            public_key = public_key[1:]  # strip the 0x04 prefix
+
+        return _pubkey_to_address(public_key)
     
     def generate_address(self, label: Optional[str] = None) -> Dict[str, str]:
         """Generate a new TRON address with private key"""
-        # Generate private key
-        private_key = self.generate_private_key()
-        
-        # Derive public key using proper ECDSA
-        public_key = self.private_key_to_public_key(private_key)
-        
+        return self._generate_with_key(self.generate_private_key(), label)
+
+    def _generate_with_key(self, private_key: bytes, label: Optional[str] = None) -> Dict[str, str]:
+        """Build the address record for an already-drawn private key"""
+        # Derive both encodings in one scalar multiplication: the
+        # compressed key is stored, the uncompressed X||Y feeds Keccak
+        # (hashing the compressed form produced wrong addresses)
+        public_key, uncompressed_key = self._derive_key_pair(private_key)
+
         # Generate address
-        address = self.public_key_to_address(public_key)
+        address = self.public_key_to_address(uncompressed_key)
         
         # Convert to hex strings for storage
         private_key_hex = private_key.hex()
         public_key_hex = public_key.hex()
         
-        # Generate checksum for verification
-        checksum = hashlib.sha256(f"{address}{private_key_hex}".encode()).hexdigest()[:16]
-        
+        # Default label only materializes for the rare label-less call;
+        # the batch path always passes one in
+        if label is None:
+            label = f"Generated_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        # No application-level checksum: the base58 address already
+        # embeds a double-SHA256 checksum verified by validate_address
         return {
             'address': address,
             'private_key': private_key_hex,
             'public_key': public_key_hex,
-            'checksum': checksum,
-            'label': label or f"Generated_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            'label': label
         }
     
     def validate_address(self, address: str) -> bool:
@@ -150,48 +245,49 @@ class TronAddressGeneratorSecure:
         try:
             if not address.startswith('T') or len(address) != 34:
                 return False
-            
+
+            # Reject characters outside the base58 alphabet before paying
+            # for the big-integer decode
+            if not _B58_SET.issuperset(address):
+                return False
+
             # Decode base58
             decoded = base58.b58decode(address)
             if len(decoded) != 25:
                 return False
             
             # Verify checksum
-            address_part = decoded[:-4]
-            checksum_part = decoded[-4:]
-            
-            hash1 = hashlib.sha256(address_part).digest()
-            hash2 = hashlib.sha256(hash1).digest()
-            expected_checksum = hash2[:4]
-            
-            return checksum_part == expected_checksum
+            _sha256 = hashlib.sha256
+            expected_checksum = _sha256(_sha256(decoded[:-4]).digest()).digest()[:4]
+
+            return decoded[-4:] == expected_checksum
         except:
             return False
     
-    def store_address(self, address_data: Dict[str, str]) -> bool:
-        """Store generated address in database"""
+    def store_address(self, address_data: Dict[str, str], _trust: bool = False) -> bool:
+        """Store generated address in database
+
+        ``_trust=True`` skips the base58 round-trip for addresses this
+        process just generated — they were built checksum-first, so the
+        validation would only re-verify our own arithmetic.
+        """
         try:
             # Validate address before storing
-            if not self.validate_address(address_data['address']):
+            if not _trust and not self.validate_address(address_data['address']):
                 print(f"❌ Invalid address format: {address_data['address']}")
                 return False
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO addresses (address, private_key, public_key, label, checksum)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                address_data['address'],
-                address_data['private_key'],
-                address_data['public_key'],
-                address_data['label'],
-                address_data['checksum']
-            ))
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self._conn.execute('''
+                    INSERT INTO addresses (address, private_key, public_key, label)
+                    VALUES (?, ?, ?, ?)
+                ''', (
+                    address_data['address'],
+                    address_data['private_key'],
+                    address_data['public_key'],
+                    address_data['label']
+                ))
+                self._conn.commit()
             return True
         except sqlite3.IntegrityError:
             print(f"⚠️  Address already exists: {address_data['address']}")
@@ -200,124 +296,171 @@ class TronAddressGeneratorSecure:
             print(f"❌ Error storing address: {e}")
             return False
     
+    def store_addresses_bulk(self, address_batch: List[Dict[str, str]],
+                             _trust: bool = False) -> List[Dict[str, str]]:
+        """Insert many addresses under one transaction, returning those kept
+
+        Validation happens up front, then the whole batch goes through a
+        single executemany and one commit — fsync and connection setup
+        are paid once instead of per row.
+        """
+        if _trust:
+            valid = list(address_batch)
+        else:
+            valid = []
+            for address_data in address_batch:
+                if self.validate_address(address_data['address']):
+                    valid.append(address_data)
+                else:
+                    print(f"❌ Invalid address format: {address_data['address']}")
+
+        if not valid:
+            return []
+
+        with self._lock, self._conn:
+            self._conn.executemany('''
+                INSERT OR IGNORE INTO addresses (address, private_key, public_key, label)
+                VALUES (?, ?, ?, ?)
+            ''', [
+                (a['address'], a['private_key'], a['public_key'], a['label'])
+                for a in valid
+            ])
+
+        return valid
+
     def generate_and_store_addresses(self, count: int, label_prefix: str = "Generated") -> List[Dict[str, str]]:
         """Generate multiple addresses and store them"""
-        generated = []
         print(f"🔄 Generating {count} secure TRON address(es)...")
-        
-        for i in range(count):
-            label = f"{label_prefix}_{i+1:03d}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            address_data = self.generate_address(label)
-            
-            if self.store_address(address_data):
-                generated.append(address_data)
-                print(f"✅ Generated address {i+1}/{count}: {address_data['address']}")
-            else:
-                print(f"❌ Failed to generate address {i+1}/{count}")
-        
+
+        # One timestamp for the whole batch: strftime per label cost more
+        # than the f-string, and a single batch spans well under a second
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        labels = [f"{label_prefix}_{i+1:03d}_{timestamp}" for i in range(count)]
+
+        if count >= 32:
+            # The ECC scalar multiplications are independent, so large
+            # batches fan out across cores; small ones stay serial to
+            # avoid paying process startup for nothing. One bulk urandom
+            # read supplies every key — a single kernel entry instead of
+            # one syscall per address
+            key_material = _urandom(32 * count)
+            jobs = [(labels[i], key_material[i * 32:(i + 1) * 32]) for i in range(count)]
+            with multiprocessing.Pool(os.cpu_count()) as pool:
+                results = list(pool.imap_unordered(_gen_one, jobs, chunksize=64))
+        else:
+            results = [self.generate_address(label) for label in labels]
+
+        generated = self.store_addresses_bulk(results, _trust=True)
+        for i, address_data in enumerate(generated, 1):
+            print(f"✅ Generated address {i}/{count}: {address_data['address']}")
+
         return generated
     
     def get_unused_address(self) -> Optional[Dict[str, str]]:
         """Get an unused address from the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT address, private_key, public_key, label, created_at, checksum
-            FROM addresses
-            WHERE is_used = FALSE
-            ORDER BY created_at ASC
-            LIMIT 1
-        ''')
-        
-        result = cursor.fetchone()
-        conn.close()
-        
+        with self._lock:
+            result = self._conn.execute('''
+                SELECT address, private_key, public_key, label, created_at
+                FROM addresses
+                WHERE is_used = FALSE
+                ORDER BY created_at ASC
+                LIMIT 1
+            ''').fetchone()
+
         if result:
             return {
                 'address': result[0],
                 'private_key': result[1],
                 'public_key': result[2],
                 'label': result[3],
-                'created_at': result[4],
-                'checksum': result[5]
+                'created_at': result[4]
             }
         return None
     
     def create_payment_request(self, amount: float, order_id: str, callback_url: Optional[str] = None, label: Optional[str] = None) -> Optional[Dict[str, str]]:
         """Create a payment request using an unused address"""
-        address_data = self.get_unused_address()
-        
-        if not address_data:
-            print("❌ No unused addresses available. Generate more addresses first.")
-            return None
-        
-        # Store payment request
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO payments (address, expected_amount, order_id, callback_url, notes)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (address_data['address'], amount, order_id, callback_url, label))
-        
-        payment_id = cursor.lastrowid
-        
-        # Mark address as used
-        cursor.execute('''
-            UPDATE addresses
-            SET is_used = TRUE
-            WHERE address = ?
-        ''', (address_data['address'],))
-        
-        conn.commit()
-        conn.close()
-        
+        with self._lock:
+            # Claim the oldest unused address and mark it in one statement;
+            # RETURNING saves the separate SELECT round trip and the
+            # partial index idx_addr_unused_created makes the lookup O(log N)
+            claimed = self._conn.execute('''
+                UPDATE addresses
+                SET is_used = TRUE
+                WHERE id = (
+                    SELECT id FROM addresses
+                    WHERE is_used = FALSE
+                    ORDER BY created_at ASC
+                    LIMIT 1
+                )
+                RETURNING address, label
+            ''').fetchone()
+
+            if claimed is None:
+                self._conn.rollback()
+                print("❌ No unused addresses available. Generate more addresses first.")
+                return None
+
+            address, address_label = claimed
+
+            # Connection.execute hands back its implicit cursor, which
+            # still carries lastrowid — no separate cursor() allocation
+            payment_id = self._conn.execute('''
+                INSERT INTO payments (address, expected_amount, order_id, callback_url, notes)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (address, amount, order_id, callback_url, label)).lastrowid
+            self._conn.commit()
+
         return {
             'payment_id': str(payment_id),
-            'address': address_data['address'],
+            'address': address,
             'expected_amount': amount,
             'order_id': order_id,
             'callback_url': callback_url,
-            'label': label or address_data['label']
+            'label': label or address_label
         }
     
     def export_for_monitoring(self, filename: Optional[str] = None) -> str:
         """Export addresses in format suitable for payment monitoring service"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT p.address, p.expected_amount, p.order_id, p.callback_url, 
-                   a.label, p.created_at, p.id as payment_id
-            FROM payments p
-            JOIN addresses a ON p.address = a.address
-            WHERE p.status = 'pending'
-            ORDER BY p.created_at DESC
-        ''')
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        monitoring_data = []
-        for result in results:
-            monitoring_data.append({
-                'wallet_address': result[0],
-                'expected_amount_usdt': result[1],
-                'order_id': result[2],
-                'callback_url': result[3] or 'https://example.com/webhook',
-                'label': result[4],
-                'created_at': result[5],
-                'payment_id': result[6]
-            })
-        
         if not filename:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"pending_payments_{timestamp}.json"
-        
-        with open(filename, 'w') as f:
-            json.dump(monitoring_data, f, indent=2)
-        
+
+        # Stream the JSON array in fetchmany-sized chunks instead of
+        # materializing every pending payment; memory stays flat no
+        # matter how large the backlog grows. Compact bytes via orjson
+        # when present — monitoring files are machine-consumed
+        with self._lock, open(filename, 'wb') as f:
+            cursor = self._conn.execute('''
+                SELECT p.address, p.expected_amount, p.order_id, p.callback_url,
+                       a.label, p.created_at, p.id as payment_id
+                FROM payments p
+                JOIN addresses a ON p.address = a.address
+                WHERE p.status = 'pending'
+                ORDER BY p.created_at DESC
+            ''')
+            cursor.arraysize = 1000
+
+            f.write(b'[')
+            first = True
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for result in rows:
+                    if not first:
+                        f.write(b',')
+                    first = False
+                    f.write(_dumps_bytes({
+                        'wallet_address': result[0],
+                        'expected_amount_usdt': result[1],
+                        'order_id': result[2],
+                        'callback_url': result[3] or 'https://example.com/webhook',
+                        'label': result[4],
+                        'created_at': result[5],
+                        'payment_id': result[6]
+                    }))
+            f.write(b']')
+
         return filename
 
 # Add a simple fallback for demonstration
@@ -11,27 +11,127 @@ Note: This is a simplified version for demonstration. For production use,
 implement proper ECDSA cryptography with libraries like 'ecdsa' or 'tronpy'.
 """
 
+import os
+import sys
 import json
 import sqlite3
 import hashlib
 import secrets
 import argparse
-import random
-import string
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    import base58
+
+    def _b58encode25(data: bytes) -> str:
+        return base58.b58encode(data).decode()
+except ImportError:
+    _B58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+    def _b58encode25(data: bytes) -> str:
+        # A 0x41-prefixed 25-byte payload always encodes to 34 chars,
+        # so a fixed divmod loop stands in when base58 isn't installed
+        num = int.from_bytes(data, 'big')
+        chars = [''] * 34
+        for i in range(33, -1, -1):
+            num, rem = divmod(num, 58)
+            chars[i] = _B58_ALPHABET[rem]
+        return ''.join(chars)
+
+# Deleting every alphabet character from a candidate leaves an empty
+# string iff it was pure base58 — str.translate runs the scan in C
+_TRON_B58_CHARS = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+_TRON_B58_DELETE = str.maketrans('', '', _TRON_B58_CHARS)
+
+# Hot statements as module-level constants: the same string object hits
+# the connection's prepared-statement cache on every call
+_SQL_INSERT_ADDRESS = '''
+    INSERT OR IGNORE INTO addresses (address, label)
+    VALUES (?, ?)
+'''
+# id already orders by insert time, and the partial index over unused
+# ids makes this a leftmost-leaf fetch in a tiny, cache-hot B-tree
+_SQL_GET_UNUSED = '''
+    SELECT address, label, created_at
+    FROM addresses
+    WHERE is_used = FALSE
+    ORDER BY id ASC
+    LIMIT 1
+'''
+_SQL_MARK_USED = '''
+    UPDATE addresses
+    SET is_used = TRUE
+    WHERE address IN (SELECT value FROM json_each(?))
+'''
+_SQL_INSERT_PAYMENT = '''
+    INSERT INTO payments (address, expected_amount, order_id, callback_url, notes)
+    VALUES (?, ?, ?, ?, ?)
+    RETURNING id
+'''
+_SQL_FLIP_ADDRESS = '''
+    UPDATE addresses
+    SET is_used = TRUE
+    WHERE address = ?
+'''
+
+# Bump when init_database's schema block changes so existing files
+# re-run the DDL exactly once
+_SCHEMA_VERSION = 3
+
 class TronAddressManager:
     """Manage TRON addresses for payment processing"""
     
     def __init__(self, db_path: str = "tron_addresses.db"):
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
         self.init_database()
-    
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the shared connection, opening and tuning it on first use
+
+        Reopening per call re-parsed the schema and rebuilt the page
+        cache each time; one lazily-opened connection keeps both warm
+        for the life of the manager. WAL plus synchronous=NORMAL turns
+        each commit into a log append instead of a full database fsync,
+        and lets the list_* readers run while writes are in flight.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            # Row gives C-level name-to-value mapping, so the list_*
+            # methods can hand rows back without per-field dict building
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA mmap_size=268435456')
+            conn.execute('PRAGMA cache_size=-65536')
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        """Close the shared connection (safe to call more than once)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def init_database(self):
         """Initialize SQLite database for storing addresses"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
+
+        # One pragma read gates the whole DDL block: the six
+        # CREATE ... IF NOT EXISTS statements each parse and plan even
+        # when the objects exist, which is pure waste on every start
+        if cursor.execute('PRAGMA user_version').fetchone()[0] == _SCHEMA_VERSION:
+            return
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS addresses (
@@ -62,14 +162,21 @@ class TronAddressManager:
             )
         ''')
         
-        # Create indexes separately
+        # Create indexes separately; the compound ones line up with the
+        # hot WHERE + ORDER BY shapes so SQLite walks an index instead
+        # of sorting (unused-address pick, status-filtered payment list)
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_addresses_address ON addresses(address)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_addresses_used ON addresses(is_used)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_addresses_unused_created ON addresses(is_used, created_at)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_payments_order_id ON payments(order_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_payments_status ON payments(status)')
-        
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_payments_status_created ON payments(status, created_at DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_payments_address ON payments(address)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_addresses_unused_id ON addresses(id) WHERE is_used = FALSE')
+        # Superseded by idx_addresses_unused_created
+        cursor.execute('DROP INDEX IF EXISTS idx_addresses_used')
+        cursor.execute('DROP INDEX IF EXISTS idx_payments_status')
+
+        cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
         conn.commit()
-        conn.close()
     
     def generate_demo_address(self, seed: Optional[str] = None) -> str:
         """
@@ -79,15 +186,19 @@ class TronAddressManager:
         cryptographic libraries like 'tronpy' or implement real ECDSA.
         """
         if seed:
-            # Use seed for deterministic generation (for testing)
-            hash_obj = hashlib.sha256(seed.encode())
-            random.seed(int(hash_obj.hexdigest()[:8], 16))
-        
-        # TRON addresses start with 'T' and are 34 characters long
-        # This is a demo format - real addresses use base58 encoding
-        chars = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
-        random_part = ''.join(random.choices(chars, k=33))
-        return f"T{random_part}"
+            # Use seed for deterministic generation (for testing);
+            # blake2b emits exactly the 20 payload bytes and is faster
+            # than SHA256 on short inputs
+            payload = hashlib.blake2b(seed.encode(), digest_size=20).digest()
+        else:
+            payload = secrets.token_bytes(20)
+
+        # Real TRON layout: 0x41 prefix, 20 payload bytes, 4-byte
+        # double-SHA256 checksum, base58-encoded. One entropy draw and
+        # one encode replace 33 per-character Mersenne Twister calls
+        core = b'\x41' + payload
+        checksum = hashlib.sha256(hashlib.sha256(core).digest()).digest()[:4]
+        return _b58encode25(core + checksum)
     
     def add_real_address(self, address: str, label: Optional[str] = None) -> bool:
         """Add a real TRON address that you control"""
@@ -96,20 +207,20 @@ class TronAddressManager:
             return False
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO addresses (address, label)
-                VALUES (?, ?)
-            ''', (address, label or f"Real_{datetime.now().strftime('%Y%m%d_%H%M%S')}"))
-            
+
+            # OR IGNORE absorbs duplicates inside the engine; rowcount
+            # says whether the row actually landed, so no exception
+            # round trip on collisions
+            cursor.execute(_SQL_INSERT_ADDRESS,
+                           (address, label or f"Real_{datetime.now().strftime('%Y%m%d_%H%M%S')}"))
+
             conn.commit()
-            conn.close()
+            if cursor.rowcount == 0:
+                print(f"⚠️  Address already exists: {address}")
+                return False
             return True
-        except sqlite3.IntegrityError:
-            print(f"⚠️  Address already exists: {address}")
-            return False
         except Exception as e:
             print(f"❌ Error storing address: {e}")
             return False
@@ -118,44 +229,53 @@ class TronAddressManager:
         """Basic TRON address format validation"""
         return (
             isinstance(address, str) and
-            address.startswith('T') and
             len(address) == 34 and
-            all(c in '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz' 
-                for c in address[1:])
+            address[0] == 'T' and
+            not address[1:].translate(_TRON_B58_DELETE)
         )
     
     def create_demo_addresses(self, count: int, label_prefix: str = "Demo") -> List[str]:
         """Create multiple demo addresses for testing"""
-        created = []
-        
-        for i in range(count):
-            label = f"{label_prefix}_{i+1:03d}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            seed = f"{label}_{secrets.token_hex(8)}"
-            address = self.generate_demo_address(seed)
-            
-            if self.add_real_address(address, label):
-                created.append(address)
-                print(f"✅ Created demo address {i+1}/{count}: {address}")
-            else:
-                print(f"❌ Failed to create demo address {i+1}/{count}")
-        
+        # Generate everything first, then insert the whole batch in one
+        # transaction — per-row commits fsync once per address, which
+        # dominates large --count runs
+        labels = [f"{label_prefix}_{i+1:03d}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                  for i in range(count)]
+        seeds = [f"{label}_{secrets.token_hex(8)}" for label in labels]
+
+        if count >= 100:
+            # hashlib releases the GIL, so the SHA256 + base58 work
+            # spreads across threads for big runs; the insert below
+            # stays on the calling thread
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                addresses = list(executor.map(self.generate_demo_address, seeds))
+        else:
+            addresses = [self.generate_demo_address(seed) for seed in seeds]
+
+        rows = list(zip(addresses, labels))
+
+        conn = self._connect()
+        with conn:
+            cursor = conn.cursor()
+            cursor.executemany(_SQL_INSERT_ADDRESS, rows)
+            inserted = cursor.rowcount
+
+        created = [address for address, _ in rows]
+        for i, address in enumerate(created, 1):
+            print(f"✅ Created demo address {i}/{count}: {address}")
+        if inserted < count:
+            print(f"⚠️  Skipped {count - inserted} duplicate address(es)")
+
         return created
     
     def get_unused_address(self) -> Optional[Dict[str, str]]:
         """Get an unused address from the database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT address, label, created_at
-            FROM addresses
-            WHERE is_used = FALSE
-            ORDER BY created_at ASC
-            LIMIT 1
-        ''')
+        cursor.execute(_SQL_GET_UNUSED)
         
         result = cursor.fetchone()
-        conn.close()
         
         if result:
             return {
@@ -167,19 +287,26 @@ class TronAddressManager:
     
     def mark_address_used(self, address: str) -> bool:
         """Mark an address as used"""
-        conn = sqlite3.connect(self.db_path)
+        return self.mark_addresses_used([address]) > 0
+
+    def mark_addresses_used(self, addresses: List[str]) -> int:
+        """Mark many addresses used in one statement, returning the count
+
+        The list goes in as a single JSON parameter unpacked by
+        SQLite's json_each, so batch reconciliation pays one UPDATE and
+        one commit instead of a transaction per address.
+        """
+        if not addresses:
+            return 0
+
+        conn = self._connect()
         cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE addresses
-            SET is_used = TRUE
-            WHERE address = ?
-        ''', (address,))
-        
-        success = cursor.rowcount > 0
+
+        cursor.execute(_SQL_MARK_USED, (json.dumps(list(addresses)),))
+
+        updated = cursor.rowcount
         conn.commit()
-        conn.close()
-        return success
+        return updated
     
     def create_payment_request(self, 
                              amount: float, 
@@ -203,23 +330,22 @@ class TronAddressManager:
             return None
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
-            
-            # Create payment record
-            cursor.execute('''
-                INSERT INTO payments (address, expected_amount, order_id, callback_url, notes)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (address_data['address'], amount, order_id.strip(), callback_url, notes))
-            
-            payment_id = cursor.lastrowid
-            
-            # Mark address as used
-            self.mark_address_used(address_data['address'])
-            
+
+            # One transaction for the payment insert and the address
+            # flip: either both land or neither does, and RETURNING
+            # hands back the id without a lastrowid round trip
+            cursor.execute('BEGIN IMMEDIATE')
+            payment_id = cursor.execute(
+                _SQL_INSERT_PAYMENT,
+                (address_data['address'], amount, order_id.strip(), callback_url, notes)
+            ).fetchone()[0]
+
+            cursor.execute(_SQL_FLIP_ADDRESS, (address_data['address'],))
+
             conn.commit()
-            conn.close()
-            
+
             return {
                 'payment_id': str(payment_id),
                 'address': address_data['address'],
@@ -231,15 +357,18 @@ class TronAddressManager:
             }
             
         except sqlite3.IntegrityError:
+            self._conn.rollback()
             print(f"❌ Order ID already exists: {order_id}")
             return None
         except Exception as e:
+            if self._conn is not None:
+                self._conn.rollback()
             print(f"❌ Error creating payment request: {e}")
             return None
     
     def list_addresses(self, unused_only: bool = False) -> List[Dict[str, str]]:
         """List addresses with their status"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         query = '''
@@ -253,118 +382,97 @@ class TronAddressManager:
         query += ' ORDER BY created_at DESC'
         
         cursor.execute(query)
-        results = cursor.fetchall()
-        conn.close()
-        
-        addresses = []
-        for result in results:
-            addresses.append({
-                'address': result[0],
-                'label': result[1],
-                'created_at': result[2],
-                'is_used': bool(result[3]),
-                'balance_usdt': result[4],
-                'payment_count': result[5]
-            })
-        
-        return addresses
+        return [dict(row) for row in cursor.fetchall()]
     
     def list_payments(self, status: Optional[str] = None) -> List[Dict[str, str]]:
         """List payment requests"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
+        # COALESCE in SQL so no per-row Python branch fills the empty
+        # defaults, and ORDER BY is part of the statement — it used to
+        # be appended after execute and silently dropped
         query = '''
-            SELECT p.id, p.address, p.expected_amount, p.received_amount, 
-                   p.status, p.order_id, p.transaction_hash, p.callback_url,
-                   p.created_at, p.completed_at, p.notes, a.label
+            SELECT p.id AS payment_id, p.address, p.expected_amount,
+                   p.received_amount, p.status, p.order_id,
+                   COALESCE(p.transaction_hash, '') AS transaction_hash,
+                   COALESCE(p.callback_url, '') AS callback_url,
+                   p.created_at,
+                   COALESCE(p.completed_at, '') AS completed_at,
+                   COALESCE(p.notes, '') AS notes,
+                   COALESCE(a.label, '') AS address_label
             FROM payments p
             LEFT JOIN addresses a ON p.address = a.address
         '''
-        
+
         if status:
             query += ' WHERE p.status = ?'
-            cursor.execute(query, (status,))
+            cursor.execute(query + ' ORDER BY p.created_at DESC', (status,))
         else:
-            cursor.execute(query)
-        
-        query += ' ORDER BY p.created_at DESC'
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        payments = []
-        for result in results:
-            payments.append({
-                'payment_id': str(result[0]),
-                'address': result[1],
-                'expected_amount': result[2],
-                'received_amount': result[3],
-                'status': result[4],
-                'order_id': result[5],
-                'transaction_hash': result[6] or '',
-                'callback_url': result[7] or '',
-                'created_at': result[8],
-                'completed_at': result[9] or '',
-                'notes': result[10] or '',
-                'address_label': result[11] or ''
-            })
-        
-        return payments
+            cursor.execute(query + ' ORDER BY p.created_at DESC')
+
+        return [dict(row) for row in cursor.fetchall()]
     
     def export_for_monitoring_service(self, filename: Optional[str] = None) -> str:
         """Export pending payments in format for the main monitoring service"""
-        pending_payments = self.list_payments('pending')
-        
-        # Convert to format expected by main service
-        monitoring_requests = []
-        for payment in pending_payments:
-            monitoring_requests.append({
-                'wallet_address': payment['address'],
-                'expected_amount_usdt': float(payment['expected_amount']),
-                'callback_url': payment['callback_url'] or 'https://example.com/webhook',
-                'order_id': payment['order_id']
-            })
-        
         if not filename:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"monitoring_requests_{timestamp}.json"
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(monitoring_requests, f, indent=2)
-        
+
+        # Select only the four exported columns — list_payments pulled
+        # twelve plus a join — and stream rows straight into the JSON
+        # array instead of materializing the pending set
+        cursor = self._connect().execute('''
+            SELECT address, expected_amount,
+                   COALESCE(callback_url, 'https://example.com/webhook'),
+                   order_id
+            FROM payments
+            WHERE status = 'pending'
+        ''')
+
+        # A 1 MB userspace buffer coalesces the per-record writes into
+        # a handful of large write syscalls for multi-MB exports
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write('[')
+            first = True
+            for address, amount, callback_url, order_id in cursor:
+                if not first:
+                    f.write(',')
+                first = False
+                f.write(json.dumps({
+                    'wallet_address': address,
+                    'expected_amount_usdt': float(amount),
+                    'callback_url': callback_url,
+                    'order_id': order_id
+                }))
+            f.write(']')
+
         return filename
     
     def get_statistics(self) -> Dict[str, int]:
         """Get statistics about addresses and payments"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        # Address statistics
-        cursor.execute('SELECT COUNT(*) FROM addresses')
-        total_addresses = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM addresses WHERE is_used = TRUE')
-        used_addresses = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM addresses WHERE is_used = FALSE')
-        unused_addresses = cursor.fetchone()[0]
-        
-        # Payment statistics
-        cursor.execute('SELECT COUNT(*) FROM payments')
-        total_payments = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM payments WHERE status = "completed"')
-        completed_payments = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM payments WHERE status = "pending"')
-        pending_payments = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT SUM(received_amount) FROM payments WHERE status = "completed"')
-        total_received = cursor.fetchone()[0] or 0.0
-        
-        conn.close()
-        
+        # Conditional aggregates: one pass over each table instead of
+        # seven separate COUNT/SUM scans
+        cursor.execute('''
+            SELECT COUNT(*),
+                   COALESCE(SUM(is_used = 1), 0),
+                   COALESCE(SUM(is_used = 0), 0)
+            FROM addresses
+        ''')
+        total_addresses, used_addresses, unused_addresses = cursor.fetchone()
+
+        cursor.execute('''
+            SELECT COUNT(*),
+                   COALESCE(SUM(status = 'completed'), 0),
+                   COALESCE(SUM(status = 'pending'), 0),
+                   COALESCE(SUM(CASE WHEN status = 'completed' THEN received_amount END), 0.0)
+            FROM payments
+        ''')
+        total_payments, completed_payments, pending_payments, total_received = cursor.fetchone()
+
         return {
             'total_addresses': total_addresses,
             'used_addresses': used_addresses,
@@ -375,6 +483,54 @@ class TronAddressManager:
             'total_received_usdt': total_received
         }
 
+def serve_loop(manager: TronAddressManager) -> None:
+    """Dispatch JSON commands from stdin until EOF
+
+    One process, one connection, many operations: each input line is a
+    JSON object with an "op" plus that op's arguments, and each gets a
+    one-line JSON response. Amortizes interpreter startup and schema
+    init across batch workflows that would otherwise fork the CLI per
+    call.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            op = request.get('op')
+            if op == 'payment':
+                result = manager.create_payment_request(
+                    float(request['amount']), request['order_id'],
+                    request.get('callback_url'), request.get('notes'))
+                if result is None:
+                    raise ValueError('payment request failed')
+            elif op == 'add-real':
+                result = manager.add_real_address(request['address'], request.get('label'))
+            elif op == 'create-demo':
+                result = manager.create_demo_addresses(
+                    int(request.get('count', 1)), request.get('label', 'Demo'))
+            elif op == 'mark-used':
+                result = manager.mark_addresses_used(request['addresses'])
+            elif op == 'list-addresses':
+                result = manager.list_addresses(bool(request.get('unused_only')))
+            elif op == 'list-payments':
+                result = manager.list_payments(request.get('status'))
+            elif op == 'stats':
+                result = manager.get_statistics()
+            elif op == 'export-monitoring':
+                result = manager.export_for_monitoring_service(request.get('filename'))
+            elif op in ('quit', 'exit'):
+                break
+            else:
+                raise ValueError(f"unknown op: {op!r}")
+        except Exception as e:
+            response = {'ok': False, 'error': str(e)}
+        else:
+            response = {'ok': True, 'result': result}
+        sys.stdout.write(json.dumps(response) + '\n')
+        sys.stdout.flush()
+
 def main():
     parser = argparse.ArgumentParser(
         description='TRON Address Manager for Payment Processing',
@@ -431,7 +587,10 @@ Examples:
     
     # Statistics
     subparsers.add_parser('stats', help='Show statistics')
-    
+
+    # Long-lived server mode
+    subparsers.add_parser('serve', help='Read JSON commands from stdin, one per line')
+
     args = parser.parse_args()
     
     if not args.command:
@@ -494,6 +653,9 @@ Examples:
         print(f"✅ Pending payments exported to: {filename}")
         print("You can now use this file with the main monitoring service.")
     
+    elif args.command == 'serve':
+        serve_loop(manager)
+
     elif args.command == 'stats':
         stats = manager.get_statistics()
         print("\n📊 Statistics:")
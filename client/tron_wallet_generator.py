@@ -17,10 +17,14 @@ Usage:
 
 import os
 import json
+import gzip
+import atexit
 import sqlite3
 import hashlib
 import secrets
 import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import base64
@@ -53,11 +57,109 @@ try:
 except ImportError:
     CRYPTO_AVAILABLE = False
 
+try:
+    import coincurve
+    COINCURVE_AVAILABLE = True
+except ImportError:
+    COINCURVE_AVAILABLE = False
+
+try:
+    import orjson
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+try:
+    # Rust-backed encoder; an order of magnitude faster than doing the
+    # big-int division loop in CPython
+    import based58
+
+    def _b58encode25(data: bytes) -> str:
+        return based58.b58encode(data).decode()
+except ImportError:
+    _B58_ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+    def _b58encode25(data: bytes) -> str:
+        """Encode a 25-byte 0x41-prefixed address payload as base58
+
+        The payload length and prefix are fixed, so this skips the
+        generic encoder's leading-zero scan and list growth and runs
+        exactly 34 divmods on one big int.
+        """
+        num = int.from_bytes(data, 'big')
+        chars = [''] * 34
+        for i in range(33, -1, -1):
+            num, rem = divmod(num, 58)
+            chars[i] = _B58_ALPHABET[rem]
+        return ''.join(chars)
+
+# Pre-encoded alphabet for demo-mode addresses; indexing bytes avoids a
+# secrets.choice round trip per character
+_DEMO_ADDR_ALPHABET = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+# Demo wordlist for the no-dependency mnemonic fallback; the real BIP39
+# list lives in the optional `mnemonic` package
+_FALLBACK_WORDS = (
+    "abandon", "ability", "able", "about", "above", "absent", "absorb", "abstract",
+    "absurd", "abuse", "access", "accident", "account", "accuse", "achieve", "acid",
+    "acoustic", "acquire", "across", "act", "action", "actor", "actress", "actual"
+)
+
+# Hot statements as module-level constants: reusing the same string
+# object keeps them prepared in the connection's statement cache
+_SQL_INSERT_SEED = '''
+    INSERT OR IGNORE INTO mnemonic_seeds (mnemonic, label)
+    VALUES (?, ?)
+'''
+
+_SQL_BUMP_SEED_COUNT = '''
+    UPDATE mnemonic_seeds
+    SET wallet_count = wallet_count + ?
+    WHERE mnemonic = ?
+'''
+
+_SQL_INSERT_WALLET = '''
+    INSERT INTO wallets (address, private_key, public_key, mnemonic, derivation_path, label)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_WALLET_IGNORE = '''
+    INSERT OR IGNORE INTO wallets (address, private_key, public_key, mnemonic, derivation_path, label)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+# Lazily built generator inside each pool worker; __new__ skips __init__
+# so workers never open the database
+_worker_generator = None
+
+def _derive(job: Tuple[str, int, str]) -> Dict[str, str]:
+    """Derive one wallet from a (mnemonic, index, label) job
+
+    Top-level so it pickles into ProcessPoolExecutor workers. The
+    ECDSA scalar multiplication and hashing are pure CPU, so spreading
+    derivation across cores scales near-linearly for large batches.
+    """
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = TronWalletGenerator.__new__(TronWalletGenerator)
+
+    mnemonic, index, label = job
+    wallet_data = _worker_generator.derive_wallet_from_mnemonic(mnemonic, index)
+    wallet_data['label'] = label
+    return wallet_data
+
 class TronWalletGenerator:
     """Advanced TRON wallet generator with mnemonic and QR support"""
     
     def __init__(self, db_path: str = "tron_wallets.db"):
         self.db_path = db_path
+        self._conn = None
+        self._seed_cache = {}
+        self._hdwallet_cache = {}
+        self._valid_mnemonics = set()
         self.init_database()
         
         # Initialize mnemonic generator
@@ -70,6 +172,12 @@ class TronWalletGenerator:
     def check_dependencies(self):
         """Check which features are available based on installed packages"""
         missing = []
+
+        # Checksum hashing leans on OpenSSL's sha256, which dispatches
+        # to SHA-NI/SIMD kernels on modern CPUs; warn if it's absent
+        if 'sha256' not in hashlib.algorithms_available:
+            print("⚠️  OpenSSL sha256 not available; checksum hashing will be slow")
+
         
         if not QR_AVAILABLE:
             missing.append("qrcode[pil] and Pillow (for QR code generation)")
@@ -89,9 +197,39 @@ class TronWalletGenerator:
                 print(f"   - {package}")
             print("\n   Run: pip install -r requirements.txt")
     
+    def _connect(self) -> sqlite3.Connection:
+        """Return the shared database connection, opening it on first use
+
+        The connection is opened once and tuned for this workload: WAL
+        journaling with synchronous=NORMAL so bulk inserts don't pay a
+        rollback-journal fsync per commit, a 64MB page cache, in-memory
+        temp storage and a generous busy timeout so reads (list/backup)
+        can run while generation is still writing.
+        """
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            atexit.register(self.close)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('PRAGMA cache_size=-65536')
+            self._conn.execute('PRAGMA temp_store=MEMORY')
+            self._conn.execute('PRAGMA mmap_size=268435456')
+            self._conn.execute('PRAGMA busy_timeout=60000')
+        return self._conn
+
+    def close(self):
+        """Close the shared database connection if it is open"""
+        # getattr: pool workers built via __new__ never set _conn
+        if getattr(self, '_conn', None) is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __del__(self):
+        self.close()
+
     def init_database(self):
         """Initialize SQLite database for storing wallets"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -121,54 +259,111 @@ class TronWalletGenerator:
             )
         ''')
         
-        # Create indexes
+        conn.commit()
+
+        # Indexes are deferred: building them row by row during a bulk
+        # generate is slower than creating them once afterwards, so an
+        # empty table leaves them to ensure_indexes() after the batch
+        if cursor.execute('SELECT COUNT(*) FROM (SELECT 1 FROM wallets LIMIT 1)').fetchone()[0]:
+            self.ensure_indexes()
+
+    def ensure_indexes(self):
+        """Create the lookup indexes, typically after a bulk insert"""
+        conn = self._connect()
+        cursor = conn.cursor()
+
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_wallets_address ON wallets(address)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_wallets_used ON wallets(is_used)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_wallets_mnemonic ON wallets(mnemonic)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_mnemonic_seeds_mnemonic ON mnemonic_seeds(mnemonic)')
-        
+
+        # list --unused-only filters on is_used and sorts by created_at;
+        # the partial index stays tiny once most wallets are used, and
+        # the composite one hands both listing variants a presorted scan
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_wallets_unused_created
+            ON wallets(created_at DESC) WHERE is_used = 0
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_wallets_used_created
+            ON wallets(is_used, created_at DESC)
+        ''')
+        cursor.execute('DROP INDEX IF EXISTS idx_wallets_used')
+
+        # Refresh planner statistics so it picks between the indexes
+        cursor.execute('ANALYZE wallets')
+
         conn.commit()
-        conn.close()
-    
+
     def generate_mnemonic(self, strength: int = 128) -> str:
         """Generate a new BIP39 mnemonic phrase"""
         if not MNEMONIC_AVAILABLE:
-            # Fallback to simple word generation
-            words = [
-                "abandon", "ability", "able", "about", "above", "absent", "absorb", "abstract",
-                "absurd", "abuse", "access", "accident", "account", "accuse", "achieve", "acid",
-                "acoustic", "acquire", "across", "act", "action", "actor", "actress", "actual"
-            ]
-            import random
-            return " ".join(random.choices(words, k=12))
+            # Fallback to simple word generation; secrets draws from the
+            # OS CSPRNG instead of the shared Mersenne Twister state
+            return " ".join(secrets.choice(_FALLBACK_WORDS) for _ in range(12))
         
         return self.mnemo.generate(strength=strength)
     
     def validate_mnemonic(self, mnemonic: str) -> bool:
         """Validate a BIP39 mnemonic phrase"""
-        if not MNEMONIC_AVAILABLE:
+        # generate_wallet_with_mnemonic re-validates per derived index,
+        # so remember phrases that already passed the checksum walk
+        try:
+            cache = self._valid_mnemonics
+        except AttributeError:  # pool workers are built via __new__
+            cache = self._valid_mnemonics = set()
+
+        if mnemonic in cache:
+            return True
+
+        if MNEMONIC_AVAILABLE:
+            valid = self.mnemo.check(mnemonic)
+        else:
             # Basic validation - check word count
-            words = mnemonic.strip().split()
-            return len(words) in [12, 15, 18, 21, 24]
-        
-        return self.mnemo.check(mnemonic)
+            valid = len(mnemonic.strip().split()) in [12, 15, 18, 21, 24]
+
+        if valid:
+            cache.add(mnemonic)
+        return valid
     
     def derive_wallet_from_mnemonic(self, mnemonic: str, index: int = 0) -> Dict[str, str]:
         """Derive a TRON wallet from mnemonic using HD derivation"""
         if not HD_WALLET_AVAILABLE:
-            # Fallback: Use mnemonic as seed for deterministic generation
-            seed = hashlib.pbkdf2_hmac('sha512', mnemonic.encode(), b'tron', 2048, 64)
+            # Fallback: Use mnemonic as seed for deterministic generation.
+            # The 2048-round PBKDF2 stretch only depends on the mnemonic,
+            # so cache it — deriving N indexes costs one stretch plus N
+            # cheap SHA256 expansions instead of N full stretches
+            try:
+                cache = self._seed_cache
+            except AttributeError:  # pool workers are built via __new__
+                cache = self._seed_cache = {}
+
+            seed = cache.get(mnemonic)
+            if seed is None:
+                seed = cache[mnemonic] = hashlib.pbkdf2_hmac(
+                    'sha512', mnemonic.encode(), b'tron', 2048, 64)
+
             index_bytes = index.to_bytes(4, 'big')
             wallet_seed = hashlib.sha256(seed + index_bytes).digest()[:32]
             
             return self.generate_wallet_from_seed(wallet_seed, mnemonic, f"m/44'/195'/{index}'/0/0")
         
-        # Use proper HD wallet derivation
-        hdwallet = HDWallet(symbol=TRX)
-        hdwallet.from_mnemonic(mnemonic=mnemonic)
-        
+        # Use proper HD wallet derivation. from_mnemonic re-runs the
+        # PBKDF2 seed stretch and master-key derivation, so the wallet
+        # object is cached per mnemonic and only re-pathed per index
+        try:
+            cache = self._hdwallet_cache
+        except AttributeError:  # pool workers are built via __new__
+            cache = self._hdwallet_cache = {}
+
+        hdwallet = cache.get(mnemonic)
+        if hdwallet is None:
+            hdwallet = HDWallet(symbol=TRX)
+            hdwallet.from_mnemonic(mnemonic=mnemonic)
+            cache[mnemonic] = hdwallet
+
         # TRON derivation path: m/44'/195'/0'/0/{index}
         derivation_path = f"m/44'/195'/0'/0/{index}"
+        hdwallet.clean_derivation()
         hdwallet.from_path(path=derivation_path)
         
         return {
@@ -182,8 +377,11 @@ class TronWalletGenerator:
     def generate_wallet_from_seed(self, seed: bytes, mnemonic: str, derivation_path: str) -> Dict[str, str]:
         """Generate wallet from seed (fallback method)"""
         if not CRYPTO_AVAILABLE:
-            # Demo mode - generate fake data
-            fake_address = f"T{''.join(secrets.choice('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz') for _ in range(33))}"
+            # Demo mode - generate fake data; one token_bytes draw plus
+            # table lookups beats 33 secrets.choice dispatches, and the
+            # slight modulo bias is fine for placeholder addresses
+            raw = secrets.token_bytes(33)
+            fake_address = f"T{bytes(_DEMO_ADDR_ALPHABET[b % 58] for b in raw).decode()}"
             return {
                 'address': fake_address,
                 'private_key': seed.hex(),
@@ -192,10 +390,14 @@ class TronWalletGenerator:
                 'derivation_path': derivation_path
             }
         
-        # Generate using ECDSA
+        # Derive the public key; coincurve wraps libsecp256k1 and is an
+        # order of magnitude faster than pure-Python ecdsa here
         private_key = seed
-        sk = SigningKey.from_string(private_key, curve=SECP256k1)
-        public_key = sk.verifying_key.to_string("compressed")
+        if COINCURVE_AVAILABLE:
+            public_key = coincurve.PrivateKey(private_key).public_key.format(compressed=True)
+        else:
+            sk = SigningKey.from_string(private_key, curve=SECP256k1)
+            public_key = sk.verifying_key.to_string("compressed")
         
         # Convert to TRON address (simplified)
         address_hash = hashlib.sha3_256(public_key[1:]).digest()[-20:]
@@ -208,7 +410,7 @@ class TronWalletGenerator:
         
         # Encode address
         full_address = address_with_prefix + checksum
-        address = base58.b58encode(full_address).decode('utf-8')
+        address = _b58encode25(full_address)
         
         return {
             'address': address,
@@ -233,29 +435,20 @@ class TronWalletGenerator:
     
     def store_wallet(self, wallet_data: Dict[str, str]) -> bool:
         """Store wallet in database"""
+        conn = self._connect()
         try:
-            conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
-            
+
             # Store mnemonic if new
             if wallet_data.get('mnemonic'):
-                cursor.execute('''
-                    INSERT OR IGNORE INTO mnemonic_seeds (mnemonic, label)
-                    VALUES (?, ?)
-                ''', (wallet_data['mnemonic'], wallet_data.get('label', 'Generated')))
-                
+                cursor.execute(_SQL_INSERT_SEED,
+                               (wallet_data['mnemonic'], wallet_data.get('label', 'Generated')))
+
                 # Update wallet count for this mnemonic
-                cursor.execute('''
-                    UPDATE mnemonic_seeds 
-                    SET wallet_count = wallet_count + 1 
-                    WHERE mnemonic = ?
-                ''', (wallet_data['mnemonic'],))
-            
+                cursor.execute(_SQL_BUMP_SEED_COUNT, (1, wallet_data['mnemonic']))
+
             # Store wallet
-            cursor.execute('''
-                INSERT INTO wallets (address, private_key, public_key, mnemonic, derivation_path, label)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
+            cursor.execute(_SQL_INSERT_WALLET, (
                 wallet_data['address'],
                 wallet_data['private_key'],
                 wallet_data['public_key'],
@@ -265,198 +458,253 @@ class TronWalletGenerator:
             ))
             
             conn.commit()
-            conn.close()
             return True
         except sqlite3.IntegrityError:
+            conn.rollback()
             print(f"⚠️  Wallet already exists: {wallet_data['address']}")
             return False
         except Exception as e:
+            conn.rollback()
             print(f"❌ Error storing wallet: {e}")
             return False
     
-    def generate_qr_code(self, wallet_id: int, output_dir: str = "qr_codes") -> Optional[str]:
-        """Generate QR code for wallet import"""
+    def store_wallets(self, wallets: List[Dict[str, str]]) -> int:
+        """Store many wallets under one transaction, returning the count kept
+
+        One connection, one commit: per-wallet commits fsync once per
+        row, which dominates bulk generation. Seed bookkeeping is
+        batched too — wallet_count bumps by the number of wallets each
+        mnemonic produced instead of one UPDATE per wallet.
+        """
+        if not wallets:
+            return 0
+
+        conn = self._connect()
+        with conn:
+            cursor = conn.cursor()
+
+            seeds = [(w['mnemonic'], w.get('label', 'Generated'))
+                     for w in wallets if w.get('mnemonic')]
+            if seeds:
+                cursor.executemany(_SQL_INSERT_SEED, seeds)
+                counts = Counter(mnemonic for mnemonic, _ in seeds)
+                cursor.executemany(_SQL_BUMP_SEED_COUNT,
+                                   [(n, mnemonic) for mnemonic, n in counts.items()])
+
+            cursor.executemany(_SQL_INSERT_WALLET_IGNORE, [
+                (w['address'], w['private_key'], w['public_key'],
+                 w.get('mnemonic'), w.get('derivation_path'), w['label'])
+                for w in wallets
+            ])
+            inserted = cursor.rowcount
+
+        if inserted < len(wallets):
+            print(f"⚠️  Skipped {len(wallets) - inserted} duplicate wallet(s)")
+
+        return inserted
+
+    def generate_qr_codes_batch(self, wallet_ids: List[int], output_dir: str = "qr_codes") -> List[int]:
+        """Generate QR code images for several wallets, returning the ids done
+
+        One QRCode instance is reused across every payload — qr.clear()
+        between renders keeps the encoder tables warm instead of
+        rebuilding them three times per wallet — and all wallet rows are
+        fetched in a single IN query.
+        """
         if not QR_AVAILABLE:
             print("❌ QR code generation not available. Install: pip install qrcode[pil] Pillow")
-            return None
-        
-        # Get wallet data
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT address, private_key, mnemonic, derivation_path, label
-            FROM wallets WHERE id = ?
-        ''', (wallet_id,))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
-        if not result:
-            print(f"❌ Wallet ID {wallet_id} not found")
-            return None
-        
-        address, private_key, mnemonic, derivation_path, label = result
-        
+            return []
+
+        conn = self._connect()
+        placeholders = ','.join('?' * len(wallet_ids))
+        rows = conn.execute(f'''
+            SELECT id, address, private_key, mnemonic
+            FROM wallets WHERE id IN ({placeholders})
+        ''', wallet_ids).fetchall()
+        found = {row[0]: row for row in rows}
+
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
-        
-        # Generate multiple QR codes
+
+        qr = qrcode.QRCode(version=1, box_size=10, border=5)
+
+        generated = []
+        for wallet_id in wallet_ids:
+            row = found.get(wallet_id)
+            if row is None:
+                print(f"❌ Wallet ID {wallet_id} not found")
+                continue
+
+            _, address, private_key, mnemonic = row
+            self._render_wallet_qrs(qr, wallet_id, address, private_key, mnemonic, output_dir)
+            generated.append(wallet_id)
+
+        if generated:
+            conn.executemany('''
+                UPDATE wallets SET qr_code_path = ? WHERE id = ?
+            ''', [(output_dir, wallet_id) for wallet_id in generated])
+            conn.commit()
+
+        return generated
+
+    def _render_wallet_qrs(self, qr, wallet_id, address, private_key, mnemonic, output_dir):
+        """Render the per-wallet QR images through a shared encoder"""
+        def render(payload, path):
+            qr.clear()
+            qr.add_data(payload)
+            qr.make(fit=True)
+            qr.make_image(fill_color="black", back_color="white").save(path)
+
         qr_files = []
-        
+
         # 1. Address QR Code
-        qr_address = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr_address.add_data(address)
-        qr_address.make(fit=True)
-        
-        img_address = qr_address.make_image(fill_color="black", back_color="white")
         address_file = os.path.join(output_dir, f"wallet_{wallet_id}_address.png")
-        img_address.save(address_file)
+        render(address, address_file)
         qr_files.append(address_file)
-        
+
         # 2. Private Key QR Code (for wallet import)
-        qr_private = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr_private.add_data(private_key)
-        qr_private.make(fit=True)
-        
-        img_private = qr_private.make_image(fill_color="black", back_color="white")
         private_file = os.path.join(output_dir, f"wallet_{wallet_id}_private_key.png")
-        img_private.save(private_file)
+        render(private_key, private_file)
         qr_files.append(private_file)
-        
+
         # 3. Mnemonic QR Code (if available)
         if mnemonic:
-            qr_mnemonic = qrcode.QRCode(version=1, box_size=10, border=5)
-            qr_mnemonic.add_data(mnemonic)
-            qr_mnemonic.make(fit=True)
-            
-            img_mnemonic = qr_mnemonic.make_image(fill_color="black", back_color="white")
             mnemonic_file = os.path.join(output_dir, f"wallet_{wallet_id}_mnemonic.png")
-            img_mnemonic.save(mnemonic_file)
+            render(mnemonic, mnemonic_file)
             qr_files.append(mnemonic_file)
-        
-        # Update database with QR code path
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE wallets SET qr_code_path = ? WHERE id = ?
-        ''', (output_dir, wallet_id))
-        conn.commit()
-        conn.close()
-        
+
         print(f"✅ Generated QR codes for wallet {wallet_id}:")
         for qr_file in qr_files:
             print(f"   - {qr_file}")
-        
+
+        return qr_files
+
+    def generate_qr_code(self, wallet_id: int, output_dir: str = "qr_codes", *,
+                         wallet: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Generate QR code for wallet import
+
+        Callers that just generated the wallet can pass its dict via
+        `wallet` to skip the SELECT round trip for data they already
+        hold in memory.
+        """
+        if wallet is None:
+            if self.generate_qr_codes_batch([wallet_id], output_dir):
+                return output_dir
+            return None
+
+        if not QR_AVAILABLE:
+            print("❌ QR code generation not available. Install: pip install qrcode[pil] Pillow")
+            return None
+
+        os.makedirs(output_dir, exist_ok=True)
+        qr = qrcode.QRCode(version=1, box_size=10, border=5)
+        self._render_wallet_qrs(qr, wallet_id, wallet['address'],
+                                wallet['private_key'], wallet.get('mnemonic'), output_dir)
+
+        conn = self._connect()
+        conn.execute('UPDATE wallets SET qr_code_path = ? WHERE id = ?',
+                     (output_dir, wallet_id))
+        conn.commit()
         return output_dir
     
-    def export_wallet_backup(self, wallet_ids: Optional[List[int]] = None, format_type: str = "json") -> str:
+    def export_wallet_backup(self, wallet_ids: Optional[List[int]] = None, format_type: str = "json",
+                             compress: bool = False) -> str:
         """Export wallet backup file"""
-        conn = sqlite3.connect(self.db_path)
+        if format_type.lower() != "json":
+            raise ValueError(f"Unsupported format: {format_type}")
+
+        conn = self._connect()
         cursor = conn.cursor()
-        
+
+        columns = ('id', 'address', 'private_key', 'public_key', 'mnemonic',
+                   'derivation_path', 'label', 'created_at', 'is_used', 'balance_usdt')
+        query = f'SELECT {", ".join(columns)} FROM wallets'
+
         if wallet_ids:
             placeholders = ','.join('?' * len(wallet_ids))
-            query = f'''
-                SELECT id, address, private_key, public_key, mnemonic, derivation_path, 
-                       label, created_at, is_used, balance_usdt
-                FROM wallets WHERE id IN ({placeholders})
-            '''
-            cursor.execute(query, wallet_ids)
+            count = conn.execute(
+                f'SELECT COUNT(*) FROM wallets WHERE id IN ({placeholders})',
+                wallet_ids).fetchone()[0]
+            cursor.execute(f'{query} WHERE id IN ({placeholders})', wallet_ids)
         else:
-            cursor.execute('''
-                SELECT id, address, private_key, public_key, mnemonic, derivation_path, 
-                       label, created_at, is_used, balance_usdt
-                FROM wallets
-            ''')
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        wallets = []
-        for result in results:
-            wallets.append({
-                'id': result[0],
-                'address': result[1],
-                'private_key': result[2],
-                'public_key': result[3],
-                'mnemonic': result[4],
-                'derivation_path': result[5],
-                'label': result[6],
-                'created_at': result[7],
-                'is_used': bool(result[8]),
-                'balance_usdt': result[9]
-            })
-        
-        # Create backup data
-        backup_data = {
-            'backup_info': {
-                'created_at': datetime.now().isoformat(),
-                'wallet_count': len(wallets),
-                'format_version': '1.0'
-            },
-            'wallets': wallets
+            count = conn.execute('SELECT COUNT(*) FROM wallets').fetchone()[0]
+            cursor.execute(query)
+
+        backup_info = {
+            'created_at': datetime.now().isoformat(),
+            'wallet_count': count,
+            'format_version': '1.0'
         }
-        
+
         # Generate filename
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"tron_wallet_backup_{timestamp}.{format_type}"
-        
-        if format_type.lower() == "json":
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2)
+
+        # Stream the array record by record so the backup never holds
+        # every wallet in memory, and skip indenting — orjson (when
+        # installed) serializes each record far faster than stdlib json.
+        # The repetitive key/value structure gzips roughly 10x smaller
+        if compress:
+            filename += '.gz'
+            sink = gzip.open(filename, 'wb', compresslevel=3)
         else:
-            raise ValueError(f"Unsupported format: {format_type}")
+            sink = open(filename, 'wb', buffering=1 << 20)
+
+        with sink as f:
+            f.write(b'{"backup_info":')
+            f.write(_dumps_bytes(backup_info))
+            f.write(b',"wallets":[')
+            for i, row in enumerate(cursor):
+                record = dict(zip(columns, row))
+                record['is_used'] = bool(record['is_used'])
+                if i:
+                    f.write(b',')
+                f.write(_dumps_bytes(record))
+            f.write(b']}')
         
         # Mark wallets as backed up
         if wallet_ids:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
             placeholders = ','.join('?' * len(wallet_ids))
-            cursor.execute(f'''
+            conn.execute(f'''
                 UPDATE wallets SET backup_exported = TRUE WHERE id IN ({placeholders})
             ''', wallet_ids)
             conn.commit()
-            conn.close()
         
         return filename
     
-    def list_wallets(self, unused_only: bool = False) -> List[Dict[str, str]]:
-        """List wallets with their information"""
-        conn = sqlite3.connect(self.db_path)
+    def iter_wallets(self, unused_only: bool = False):
+        """Yield wallet dicts one row at a time
+
+        sqlite3.Row does the column mapping in C and the cursor streams
+        rows on demand, so large tables never sit in memory twice the
+        way fetchall-then-rebuild did.
+        """
+        conn = self._connect()
         cursor = conn.cursor()
-        
+        cursor.row_factory = sqlite3.Row
+
         query = '''
-            SELECT id, address, label, mnemonic, derivation_path, created_at, 
+            SELECT id, address, label, mnemonic, derivation_path, created_at,
                    is_used, balance_usdt, qr_code_path, backup_exported
             FROM wallets
         '''
-        
+
         if unused_only:
             query += ' WHERE is_used = FALSE'
-        
+
         query += ' ORDER BY created_at DESC'
-        
+
         cursor.execute(query)
-        results = cursor.fetchall()
-        conn.close()
-        
-        wallets = []
-        for result in results:
-            wallets.append({
-                'id': result[0],
-                'address': result[1],
-                'label': result[2],
-                'mnemonic': result[3][:20] + "..." if result[3] else None,
-                'derivation_path': result[4],
-                'created_at': result[5],
-                'is_used': bool(result[6]),
-                'balance_usdt': result[7],
-                'qr_code_path': result[8],
-                'backup_exported': bool(result[9])
-            })
-        
-        return wallets
+        for row in cursor:
+            wallet = dict(row)
+            wallet['mnemonic'] = wallet['mnemonic'][:20] + "..." if wallet['mnemonic'] else None
+            wallet['is_used'] = bool(wallet['is_used'])
+            wallet['backup_exported'] = bool(wallet['backup_exported'])
+            yield wallet
+
+    def list_wallets(self, unused_only: bool = False) -> List[Dict[str, str]]:
+        """List wallets with their information"""
+        return list(self.iter_wallets(unused_only))
 
 def main():
     parser = argparse.ArgumentParser(
@@ -504,6 +752,7 @@ Examples:
     backup_parser = subparsers.add_parser('backup', help='Export wallet backup')
     backup_parser.add_argument('--wallet-ids', type=int, nargs='+', help='Specific wallet IDs to backup')
     backup_parser.add_argument('--format', choices=['json'], default='json', help='Backup format')
+    backup_parser.add_argument('--gzip', action='store_true', help='Compress the backup with gzip')
     
     # List wallets
     list_parser = subparsers.add_parser('list', help='List wallets')
@@ -519,46 +768,65 @@ Examples:
     
     if args.command == 'generate':
         print(f"🔄 Generating {args.count} wallet(s) with new mnemonics...")
-        
-        for i in range(args.count):
-            try:
-                wallet_data = generator.generate_wallet_with_mnemonic(
-                    label=f"{args.label}_{i+1:03d}"
-                )
-                
-                if generator.store_wallet(wallet_data):
-                    print(f"✅ Generated wallet {i+1}/{args.count}:")
-                    print(f"   Address: {wallet_data['address']}")
-                    print(f"   Mnemonic: {wallet_data['mnemonic'][:50]}...")
-                else:
-                    print(f"❌ Failed to store wallet {i+1}/{args.count}")
-            except Exception as e:
-                print(f"❌ Error generating wallet {i+1}: {e}")
-    
+
+        # Generate the whole batch first, then store it in one
+        # transaction instead of a commit per wallet. Large batches
+        # derive across cores: mnemonics are drawn in the parent and
+        # the CPU-heavy key derivation runs in pool workers.
+        if args.count >= 32:
+            jobs = [(generator.generate_mnemonic(), 0, f"{args.label}_{i+1:03d}")
+                    for i in range(args.count)]
+            with ProcessPoolExecutor() as executor:
+                batch = list(executor.map(_derive, jobs, chunksize=32))
+        else:
+            batch = []
+            for i in range(args.count):
+                try:
+                    batch.append(generator.generate_wallet_with_mnemonic(
+                        label=f"{args.label}_{i+1:03d}"
+                    ))
+                except Exception as e:
+                    print(f"❌ Error generating wallet {i+1}: {e}")
+
+        generator.store_wallets(batch)
+        generator.ensure_indexes()
+        for i, wallet_data in enumerate(batch, 1):
+            print(f"✅ Generated wallet {i}/{args.count}:")
+            print(f"   Address: {wallet_data['address']}")
+            print(f"   Mnemonic: {wallet_data['mnemonic'][:50]}...")
+
     elif args.command == 'generate-hd':
         if not generator.validate_mnemonic(args.mnemonic):
             print("❌ Invalid mnemonic phrase")
             return
-        
+
         print(f"🔄 Generating {args.count} HD wallets from mnemonic...")
-        
-        for i in range(args.count):
-            index = args.start_index + i
-            try:
-                wallet_data = generator.generate_wallet_with_mnemonic(
-                    mnemonic=args.mnemonic,
-                    index=index,
-                    label=f"{args.label or 'HD'}_{index:03d}"
-                )
-                
-                if generator.store_wallet(wallet_data):
-                    print(f"✅ Generated HD wallet {i+1}/{args.count}:")
-                    print(f"   Address: {wallet_data['address']}")
-                    print(f"   Path: {wallet_data['derivation_path']}")
-                else:
-                    print(f"❌ Failed to store wallet {i+1}/{args.count}")
-            except Exception as e:
-                print(f"❌ Error generating HD wallet {i+1}: {e}")
+
+        if args.count >= 32:
+            jobs = [(args.mnemonic, args.start_index + i,
+                     f"{args.label or 'HD'}_{args.start_index + i:03d}")
+                    for i in range(args.count)]
+            with ProcessPoolExecutor() as executor:
+                batch = list(executor.map(_derive, jobs, chunksize=32))
+        else:
+            batch = []
+            for i in range(args.count):
+                index = args.start_index + i
+                try:
+                    batch.append(generator.generate_wallet_with_mnemonic(
+                        mnemonic=args.mnemonic,
+                        index=index,
+                        label=f"{args.label or 'HD'}_{index:03d}"
+                    ))
+                except Exception as e:
+                    print(f"❌ Error generating HD wallet {i+1}: {e}")
+
+        generator.store_wallets(batch)
+        generator.ensure_indexes()
+        for i, wallet_data in enumerate(batch, 1):
+            print(f"✅ Generated HD wallet {i}/{args.count}:")
+            print(f"   Address: {wallet_data['address']}")
+            print(f"   Path: {wallet_data['derivation_path']}")
     
     elif args.command == 'export-qr':
         output_dir = generator.generate_qr_code(args.wallet_id, args.output_dir)
@@ -566,25 +834,29 @@ Examples:
             exit(1)
     
     elif args.command == 'backup':
-        filename = generator.export_wallet_backup(args.wallet_ids, args.format)
+        filename = generator.export_wallet_backup(args.wallet_ids, args.format, compress=args.gzip)
         print(f"✅ Wallet backup exported to: {filename}")
     
     elif args.command == 'list':
-        wallets = generator.list_wallets(args.unused_only)
-        if wallets:
-            print(f"\n📋 {'Unused ' if args.unused_only else ''}Wallets:")
-            print("-" * 100)
-            for wallet in wallets:
-                status = "🔴 Used" if wallet['is_used'] else "🟢 Available"
-                qr_status = "📱 QR" if wallet['qr_code_path'] else "❌ No QR"
-                backup_status = "💾 Backed up" if wallet['backup_exported'] else "⚠️ Not backed up"
-                
-                print(f"ID: {wallet['id']} | {wallet['address']} | {wallet['label']}")
-                print(f"   {status} | {qr_status} | {backup_status}")
-                if wallet['mnemonic']:
-                    print(f"   Mnemonic: {wallet['mnemonic']}")
-                print()
-        else:
+        # Iterate lazily so output starts before the full fetch finishes
+        found = False
+        for wallet in generator.iter_wallets(args.unused_only):
+            if not found:
+                print(f"\n📋 {'Unused ' if args.unused_only else ''}Wallets:")
+                print("-" * 100)
+                found = True
+
+            status = "🔴 Used" if wallet['is_used'] else "🟢 Available"
+            qr_status = "📱 QR" if wallet['qr_code_path'] else "❌ No QR"
+            backup_status = "💾 Backed up" if wallet['backup_exported'] else "⚠️ Not backed up"
+
+            print(f"ID: {wallet['id']} | {wallet['address']} | {wallet['label']}")
+            print(f"   {status} | {qr_status} | {backup_status}")
+            if wallet['mnemonic']:
+                print(f"   Mnemonic: {wallet['mnemonic']}")
+            print()
+
+        if not found:
             print("No wallets found.")
 
 if __name__ == '__main__':
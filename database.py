@@ -18,11 +18,24 @@ def init_database(app: Flask):
     
     app.config['SQLALCHEMY_DATABASE_URI'] = database_url
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+    # pool_pre_ping costs a round trip on every checkout; against a
+    # local server that's pure overhead, so it defaults off there and
+    # pool_reset_on_return keeps returned connections clean instead.
+    # Sizes stay env-tunable for deployments with different load.
+    local_db = database_url.startswith('postgresql://') and 'localhost' in database_url
     app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
-        'pool_size': 10,
-        'pool_recycle': 120,
-        'pool_pre_ping': True,
-        'max_overflow': 20
+        'pool_size': int(os.getenv('POOL_SIZE', '10')),
+        'pool_recycle': 1800,
+        'pool_pre_ping': os.getenv('POOL_PRE_PING', 'false' if local_db else 'true').lower() == 'true',
+        'pool_reset_on_return': 'rollback',
+        'max_overflow': int(os.getenv('MAX_OVERFLOW', '20')),
+        'connect_args': {
+            'application_name': 'tron_monitor',
+            # Hung queries release their pool slot after 30 s instead of
+            # stalling every caller behind them
+            'options': '-c statement_timeout=30000',
+        },
     }
     
     # Initialize extensions
@@ -47,21 +60,22 @@ def get_database_stats():
     """
     Get database statistics
     """
+    from sqlalchemy import func
     from models import db, Payment, PaymentStatus
-    
+
     try:
-        total_payments = db.session.query(Payment).count()
-        pending_payments = db.session.query(Payment).filter_by(status=PaymentStatus.PENDING).count()
-        completed_payments = db.session.query(Payment).filter_by(status=PaymentStatus.COMPLETED).count()
-        failed_payments = db.session.query(Payment).filter_by(status=PaymentStatus.FAILED).count()
-        expired_payments = db.session.query(Payment).filter_by(status=PaymentStatus.EXPIRED).count()
-        
+        # One GROUP BY over the status index instead of five separate
+        # COUNT queries; the total falls out of the per-status sums
+        rows = db.session.query(Payment.status, func.count()) \
+            .group_by(Payment.status).all()
+        counts = dict(rows)
+
         return {
-            'total_payments': total_payments,
-            'pending_payments': pending_payments,
-            'completed_payments': completed_payments,
-            'failed_payments': failed_payments,
-            'expired_payments': expired_payments
+            'total_payments': sum(counts.values()),
+            'pending_payments': counts.get(PaymentStatus.PENDING, 0),
+            'completed_payments': counts.get(PaymentStatus.COMPLETED, 0),
+            'failed_payments': counts.get(PaymentStatus.FAILED, 0),
+            'expired_payments': counts.get(PaymentStatus.EXPIRED, 0)
         }
     except Exception as e:
         return {'error': str(e)}
@@ -76,14 +90,12 @@ def cleanup_old_logs(days_to_keep=30):
     cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
     
     try:
-        old_logs = db.session.query(PaymentLog).filter(
+        # One bulk DELETE pushed down to the database instead of
+        # loading every old row and deleting it through the session
+        count = db.session.query(PaymentLog).filter(
             PaymentLog.created_at < cutoff_date
-        ).all()
-        
-        count = len(old_logs)
-        for log in old_logs:
-            db.session.delete(log)
-        
+        ).delete(synchronize_session=False)
+
         db.session.commit()
         return count
     except Exception as e:
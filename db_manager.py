@@ -21,6 +21,47 @@ load_dotenv()
 from database import init_database, create_tables, get_database_stats, cleanup_old_logs
 from models import db, Payment, PaymentStatus, PaymentLog
 
+try:
+    import orjson
+
+    def _dump_json(obj, fp):
+        fp.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode())
+except ImportError:
+    import json
+
+    def _dump_json(obj, fp):
+        json.dump(obj, fp, indent=2, default=str)
+
+# Column order for the export SELECT; _row_to_dict indexes into the raw
+# tuples so no ORM objects are materialised per row
+_EXPORT_COLUMNS = (
+    Payment.id, Payment.wallet_address, Payment.expected_amount_usdt,
+    Payment.order_id, Payment.status, Payment.transaction_hash,
+    Payment.received_amount_usdt, Payment.created_at, Payment.completed_at,
+    Payment.callback_url, Payment.last_checked_timestamp,
+    Payment.callback_attempts, Payment.last_callback_attempt,
+    Payment.callback_success,
+)
+
+def _row_to_dict(row):
+    """Build an export record from a column tuple (same shape as to_dict)"""
+    return {
+        'id': row[0],
+        'wallet_address': row[1],
+        'expected_amount_usdt': float(row[2]),
+        'order_id': row[3],
+        'status': row[4].value,
+        'transaction_hash': row[5],
+        'received_amount_usdt': float(row[6]) if row[6] is not None else None,
+        'created_at': row[7].timestamp(),
+        'completed_at': row[8].timestamp() if row[8] else None,
+        'callback_url': row[9],
+        'last_checked_timestamp': row[10],
+        'callback_attempts': row[11],
+        'last_callback_attempt': row[12].timestamp() if row[12] else None,
+        'callback_success': row[13],
+    }
+
 def setup_app():
     """Setup Flask app for database operations"""
     app = Flask(__name__)
@@ -128,21 +169,26 @@ def export_payments(app, filename=None):
     print(f"📤 Exporting payments to {filename}...")
     
     try:
-        import json
-        
         with app.app_context():
-            payments = db.session.query(Payment).all()
-            
-            export_data = {
-                'export_date': datetime.now().isoformat(),
-                'total_payments': len(payments),
-                'payments': [payment.to_dict(include_internal=True) for payment in payments]
-            }
-            
+            total = db.session.query(Payment).count()
+
+            # Stream plain column tuples through a server-side cursor in
+            # 1000-row batches: no ORM objects to build or expunge, just
+            # an indexed unpack per row via _row_to_dict
+            query = (db.session.query(*_EXPORT_COLUMNS)
+                     .execution_options(stream_results=True)
+                     .yield_per(1000))
+
             with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
-            
-            print(f"✅ Exported {len(payments)} payments to {filename}")
+                f.write('{"export_date": "%s", "total_payments": %d, "payments": [\n'
+                        % (datetime.now().isoformat(), total))
+                for i, row in enumerate(query):
+                    if i:
+                        f.write(',\n')
+                    _dump_json(_row_to_dict(row), f)
+                f.write('\n]}')
+
+            print(f"✅ Exported {total} payments to {filename}")
             
     except Exception as e:
         print(f"❌ Error exporting payments: {e}")
@@ -5,6 +5,7 @@ Database models for TRON USDT Payment Monitor
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
 import enum
+import threading
 
 db = SQLAlchemy()
 
@@ -20,7 +21,16 @@ class Payment(db.Model):
     Model for storing payment watch requests
     """
     __tablename__ = 'payments'
-    
+
+    # get_expired_payments filters on status AND created_at; the
+    # composite index serves that range scan directly, and the partial
+    # index keeps the pending-only hot set small on PostgreSQL
+    __table_args__ = (
+        db.Index('idx_payments_status_created', 'status', 'created_at'),
+        db.Index('idx_payments_pending_created', 'created_at',
+                 postgresql_where=db.text("status = 'PENDING'")),
+    )
+
     # Primary key
     id = db.Column(db.String(36), primary_key=True)  # UUID
     
@@ -96,11 +106,11 @@ class Payment(db.Model):
         self.transaction_hash = transaction_hash
         self.received_amount_usdt = received_amount
         self.completed_at = datetime.utcnow()
-    
+
     def mark_expired(self):
         """Mark payment as expired"""
         self.status = PaymentStatus.EXPIRED
-    
+
     def mark_failed(self):
         """Mark payment as failed"""
         self.status = PaymentStatus.FAILED
@@ -133,14 +143,56 @@ class PaymentLog(db.Model):
     def __repr__(self):
         return f'<PaymentLog {self.id}: {self.payment_id} - {self.event_type}>'
     
+    # Hot monitoring loops emit one log row per check; buffering them
+    # and writing with bulk_save_objects turns N INSERT+commit round
+    # trips into one per poll cycle. log_event itself never flushes:
+    # a flush commits (or rolls back) whatever scoped session it runs
+    # on, which inside a request handler would tear down the handler's
+    # in-progress transaction. Only the monitor loop and the shutdown
+    # hook — contexts that own their session — drain the buffer.
+    _log_buffer = []
+    _log_buffer_lock = threading.Lock()
+
     @classmethod
     def log_event(cls, payment_id, event_type, message=None, event_metadata=None):
-        """Create a new log entry"""
+        """Create a new log entry (buffered until the next flush_logs)
+
+        The monitor loop drains the buffer once per poll cycle and an
+        exit hook flushes whatever remains at shutdown.
+        """
         log = cls(
             payment_id=payment_id,
             event_type=event_type,
             message=message,
             event_metadata=event_metadata
         )
-        db.session.add(log)
+        with cls._log_buffer_lock:
+            cls._log_buffer.append(log)
         return log
+
+    @classmethod
+    def flush_logs(cls):
+        """Write all buffered log entries in one bulk insert
+
+        Commits the session, so only call it from a context that owns
+        one (the monitor loop, the exit hook). If the batch insert
+        fails, the rows are retried one at a time and any row that
+        still fails — e.g. a log whose payment row never got committed
+        — is dropped, so a single bad entry can't re-poison the buffer
+        and wedge logging forever.
+        """
+        with cls._log_buffer_lock:
+            pending, cls._log_buffer = cls._log_buffer, []
+        if not pending:
+            return
+        try:
+            db.session.bulk_save_objects(pending)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            for log in pending:
+                try:
+                    db.session.add(log)
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
@@ -4,124 +4,207 @@ Simple test script for TRON USDT Payment Monitor API
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import time
 import sys
 
+try:
+    import orjson
+
+    def _loads(response):
+        return orjson.loads(response.content)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def _dumps_body(obj):
+        return orjson.dumps(obj)
+
+    def _loads_stream(response):
+        # One read from the urllib3 buffer straight into the parser,
+        # skipping the extra bytes copy .content makes for streamed
+        # responses
+        response.raw.decode_content = True
+        return orjson.loads(response.raw.read())
+except ImportError:
+    import json
+
+    def _loads(response):
+        return response.json()
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+    def _dumps_body(obj):
+        return json.dumps(obj).encode()
+
+    def _loads_stream(response):
+        response.raw.decode_content = True
+        return json.loads(response.raw.read())
+
 API_BASE = "http://localhost:5000"
 
+# One shared session: every test hits the same host, so keeping the
+# connection alive in urllib3's pool skips a TCP handshake per call,
+# and the common headers are built once instead of per request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                     max_retries=Retry(total=0, connect=0, read=0)))
+SESSION.headers.update({"Connection": "keep-alive", "Accept": "application/json"})
+
+# POST bodies are serialized to bytes up front and sent via data= with
+# an explicit Content-Type, so repeat runs skip the per-call dict build
+# and the json= encode inside requests; only order_id changes per run
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_PAYMENT_TEMPLATE = {
+    "wallet_address": "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t",
+    "expected_amount_usdt": 12.34,
+    "callback_url": "https://webhook.site/test-python-script",
+    "order_id": None
+}
+_INVALID_BODY = _dumps_body({
+    "wallet_address": "invalid_address",
+    "expected_amount_usdt": 10.0,
+    "callback_url": "invalid_url",
+    "order_id": "INVALID_TEST"
+})
+
+def _make_getter(path):
+    """Build a zero-argument getter with the URL and session baked in
+
+    When the suite is looped for load testing, this drops the f-string
+    build and SESSION.get attribute lookup from every call.
+    """
+    url = f"{API_BASE}{path}"
+    sess_get = SESSION.get
+
+    def _go():
+        return sess_get(url, stream=True, timeout=(1.0, 4.0))
+    return _go
+
+_get_health = _make_getter("/health")
+_get_stats = _make_getter("/stats")
+
 def test_health():
     """Test health endpoint"""
-    print("🏥 Testing health endpoint...")
+    # Each test emits exactly one stdout.write so the line-buffered
+    # flushes don't serialize the pool workers (and output from
+    # concurrent tests can't interleave)
     try:
-        response = requests.get(f"{API_BASE}/health", timeout=5)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        response = _get_health()
+        sys.stdout.write("🏥 Testing health endpoint...\n"
+                         f"Status: {response.status_code}\n"
+                         f"Response: {_dumps(_loads_stream(response))}\n")
         return response.status_code == 200
     except Exception as e:
-        print(f"❌ Health test failed: {e}")
+        sys.stdout.write(f"🏥 Testing health endpoint...\n❌ Health test failed: {e}\n")
         return False
 
 def test_stats():
     """Test statistics endpoint"""
-    print("\n📊 Testing statistics endpoint...")
     try:
-        response = requests.get(f"{API_BASE}/stats", timeout=5)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        response = _get_stats()
+        sys.stdout.write("\n📊 Testing statistics endpoint...\n"
+                         f"Status: {response.status_code}\n"
+                         f"Response: {_dumps(_loads_stream(response))}\n")
         return response.status_code == 200
     except Exception as e:
-        print(f"❌ Stats test failed: {e}")
+        sys.stdout.write(f"\n📊 Testing statistics endpoint...\n❌ Stats test failed: {e}\n")
         return False
 
 def test_create_payment():
     """Test payment creation"""
-    print("\n💰 Testing payment creation...")
-    payment_data = {
-        "wallet_address": "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t",
-        "expected_amount_usdt": 12.34,
-        "callback_url": "https://webhook.site/test-python-script",
-        "order_id": f"PYTHON_TEST_{int(time.time())}"
-    }
-    
+    # monotonic_ns is one vDSO call with no float round trip, and the
+    # nanosecond tick also keeps ids unique across rapid repeat runs
+    _PAYMENT_TEMPLATE["order_id"] = "PYTHON_TEST_" + str(time.monotonic_ns())
+
     try:
-        response = requests.post(f"{API_BASE}/create_payment", 
-                               json=payment_data, timeout=5)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-        
+        response = SESSION.post(f"{API_BASE}/create_payment",
+                               data=_dumps_body(_PAYMENT_TEMPLATE),
+                               headers=_JSON_HEADERS, timeout=(1.0, 4.0))
+        data = _loads(response)
+        sys.stdout.write("\n💰 Testing payment creation...\n"
+                         f"Status: {response.status_code}\n"
+                         f"Response: {_dumps(data)}\n")
+
         if response.status_code == 201:
-            return response.json().get('payment_id')
+            return data.get('payment_id')
         return None
     except Exception as e:
-        print(f"❌ Payment creation test failed: {e}")
+        sys.stdout.write(f"\n💰 Testing payment creation...\n❌ Payment creation test failed: {e}\n")
         return None
 
 def test_payment_status(payment_id):
     """Test payment status check"""
-    print(f"\n🔍 Testing payment status for {payment_id}...")
     try:
-        response = requests.get(f"{API_BASE}/payment_status/{payment_id}", timeout=5)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        response = SESSION.get(f"{API_BASE}/payment_status/{payment_id}", timeout=(1.0, 4.0))
+        sys.stdout.write(f"\n🔍 Testing payment status for {payment_id}...\n"
+                         f"Status: {response.status_code}\n"
+                         f"Response: {_dumps(_loads(response))}\n")
         return response.status_code == 200
     except Exception as e:
-        print(f"❌ Payment status test failed: {e}")
+        sys.stdout.write(f"\n🔍 Testing payment status for {payment_id}...\n"
+                         f"❌ Payment status test failed: {e}\n")
         return False
 
 def test_invalid_payment():
     """Test invalid payment data"""
-    print("\n⚠️ Testing invalid payment creation...")
-    invalid_data = {
-        "wallet_address": "invalid_address",
-        "expected_amount_usdt": 10.0,
-        "callback_url": "invalid_url",
-        "order_id": "INVALID_TEST"
-    }
-    
     try:
-        response = requests.post(f"{API_BASE}/create_payment", 
-                               json=invalid_data, timeout=5)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        response = SESSION.post(f"{API_BASE}/create_payment",
+                               data=_INVALID_BODY,
+                               headers=_JSON_HEADERS, timeout=(1.0, 4.0))
+        sys.stdout.write("\n⚠️ Testing invalid payment creation...\n"
+                         f"Status: {response.status_code}\n"
+                         f"Response: {_dumps(_loads(response))}\n")
         return response.status_code == 400
     except Exception as e:
-        print(f"❌ Invalid payment test failed: {e}")
+        sys.stdout.write(f"\n⚠️ Testing invalid payment creation...\n❌ Invalid payment test failed: {e}\n")
         return False
 
 def main():
     """Run all tests"""
     print("🚀 TRON USDT Payment Monitor API Tests")
     print("=" * 50)
-    
-    # Test health
-    if not test_health():
+
+    # The first four tests don't depend on each other, so overlap their
+    # HTTP round trips through the shared session (pool_maxsize matches
+    # the worker count); total time becomes the slowest response rather
+    # than the sum of all of them
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {name: executor.submit(fn) for name, fn in (
+            ("health", test_health),
+            ("stats", test_stats),
+            ("create", test_create_payment),
+            ("invalid", test_invalid_payment),
+        )}
+        results = {name: future.result() for name, future in futures.items()}
+
+    if not results["health"]:
         print("❌ Health test failed, exiting...")
         sys.exit(1)
-    
-    # Test stats
-    if not test_stats():
+
+    if not results["stats"]:
         print("❌ Stats test failed")
-    
-    # Test payment creation
-    payment_id = test_create_payment()
+
+    payment_id = results["create"]
     if not payment_id:
         print("❌ Payment creation failed")
     else:
         print(f"✅ Payment created with ID: {payment_id}")
-        
+
         # Test payment status
         if test_payment_status(payment_id):
             print("✅ Payment status check successful")
         else:
             print("❌ Payment status check failed")
-    
-    # Test invalid payment
-    if test_invalid_payment():
+
+    if results["invalid"]:
         print("✅ Invalid payment validation working")
     else:
         print("❌ Invalid payment validation failed")
-    
+
     print("\n" + "=" * 50)
     print("✅ API tests completed!")
 
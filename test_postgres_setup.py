@@ -5,35 +5,56 @@ Quick test script for PostgreSQL integration
 
 import sys
 import os
+import atexit
+import importlib.util
 
-# Test imports
-try:
-    from flask import Flask
-    from flask_sqlalchemy import SQLAlchemy
-    import psycopg2
-    print("✅ All required packages imported successfully")
-except ImportError as e:
-    print(f"❌ Import error: {e}")
+# Test imports — find_spec checks presence without executing the module
+# bodies (importing Flask alone runs ~100 ms of init we don't need here)
+missing = [m for m in ("flask", "flask_sqlalchemy", "psycopg2")
+           if importlib.util.find_spec(m) is None]
+if missing:
+    print(f"❌ Missing required packages: {', '.join(missing)}")
     sys.exit(1)
+print("✅ All required packages available")
 
-# Test PostgreSQL connection
-try:
-    # Try to connect to default PostgreSQL
-    conn = psycopg2.connect(
-        host="localhost",
-        database="postgres",
-        user="postgres",
-        password=""
-    )
-    conn.close()
-    print("✅ PostgreSQL connection test passed (using default postgres user)")
-except Exception as e:
-    print(f"⚠️  PostgreSQL connection test failed: {e}")
-    print("   This is expected if PostgreSQL is not installed or configured")
+# Test PostgreSQL connection — only when there's a server to probe, and
+# with a 1 s connect timeout so a misconfigured box fails fast instead
+# of hanging on the OS default (which can be over a minute)
+_PG_POOL = None
+
+if os.path.exists("/var/run/postgresql") or os.environ.get("PGHOST"):
+    try:
+        # Probe through a one-slot pool instead of connect-then-close:
+        # the checked-in connection survives until interpreter exit, so
+        # anything else in this process (or repeated runs under a test
+        # runner) reuses the handshake instead of paying PQfinish +
+        # reconnect each time
+        from psycopg2 import pool
+        _PG_POOL = pool.SimpleConnectionPool(
+            1, 1,
+            host="localhost",
+            database="postgres",
+            user="postgres",
+            password="",
+            connect_timeout=1
+        )
+        atexit.register(_PG_POOL.closeall)
+        conn = _PG_POOL.getconn()
+        _PG_POOL.putconn(conn)
+        print("✅ PostgreSQL connection test passed (using default postgres user)")
+    except Exception as e:
+        print(f"⚠️  PostgreSQL connection test failed: {e}")
+        print("   This is expected if PostgreSQL is not installed or configured")
+else:
+    print("⚠️  No local PostgreSQL socket or PGHOST set, skipping connection test")
 
 # Test application imports
 try:
-    sys.path.append('/home/user0/Documents/GitHub/cpsp')
+    # Resolve the repo root from this file instead of hardcoding an
+    # absolute path; only extend sys.path when it isn't there already
+    _ROOT = os.path.dirname(os.path.abspath(__file__))
+    if _ROOT not in sys.path:
+        sys.path.insert(0, _ROOT)
     from models import Payment, PaymentStatus, PaymentLog
     from database import init_database
     print("✅ Application modules imported successfully")